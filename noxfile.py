@@ -9,13 +9,18 @@ os.environ["PYENV_VERSION"] = "3.11.13:3.12.11:3.13.0:3.14.0"
 nox.options.pythons = PYTHON_VERSIONS
 nox.options.reuse_existing_virtualenvs = True
 
+# Run the suite in parallel (pytest-xdist is in the test extras). loadfile
+# keeps each test file on one worker, so session fixtures are built once
+# per worker rather than once per test.
+PYTEST_XDIST_ARGS = ("-n", "auto", "--dist=loadfile")
+
 
 @nox.session(python=PYTHON_VERSIONS)
 def test(session: nox.Session) -> None:
     """Run tests with pytest."""
     session.run("uv", "pip", "install", "-e", ".[test]", external=True)
     session.run("uv", "pip", "install", "pytest-cov", external=True)
-    session.run("pytest", "tests/", "-v", "--cov=render_engine_pg")
+    session.run("pytest", "tests/", "-v", *PYTEST_XDIST_ARGS, "--cov=render_engine_pg")
 
 
 @nox.session(python=PYTHON_VERSIONS)
@@ -31,4 +36,4 @@ def check(session: nox.Session) -> None:
     session.run("uv", "pip", "install", "-e", ".[test]", external=True)
     session.run("uv", "pip", "install", "pytest-cov", external=True)
     session.run("mypy", "render_engine_pg", f"--python-version={session.python}")
-    session.run("pytest", "tests/", "-v", "--cov=render_engine_pg")
+    session.run("pytest", "tests/", "-v", *PYTEST_XDIST_ARGS, "--cov=render_engine_pg")
@@ -2,6 +2,7 @@
 Relationship analyzer for render-engine objects
 """
 
+import re
 from typing import List, Dict, Any, Set
 from dataclasses import dataclass
 
@@ -26,6 +27,9 @@ class RelationshipAnalyzer:
         r".*_ref$",  # Ends with _ref
     ]
 
+    # Suffixes stripped from a column name to guess the table it references
+    FK_SUFFIX_PATTERN = re.compile(r"(_id|_ref|_fk)$", re.IGNORECASE)
+
     def analyze(self, objects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Analyze relationships between objects.
@@ -215,10 +219,8 @@ class RelationshipAnalyzer:
         Returns:
             Target object name or None
         """
-        import re
-
         # Remove common suffixes
-        base_name = re.sub(r"(_id|_ref|_fk)$", "", column, flags=re.IGNORECASE)
+        base_name = self.FK_SUFFIX_PATTERN.sub("", column)
 
         # Check if base name matches any table exactly
         for table, obj_name in table_mapping.items():
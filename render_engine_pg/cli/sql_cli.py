@@ -10,9 +10,10 @@ Supports:
 - Ignoring PRIMARY KEY and TIMESTAMP columns (--ignore-pk, --ignore-timestamps)
 """
 
+import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TextIO
 
 import click
 
@@ -69,126 +70,159 @@ def main(
         render-engine-pg schema.sql --ignore-pk -o config.toml -v
     """
     try:
-        # Validate file extension
-        if input_file.suffix != ".sql":
-            click.secho(
-                "Warning: File does not have .sql extension",
-                fg="yellow",
-            )
+        run(
+            input_file,
+            output=output,
+            verbose=verbose,
+            interactive=interactive,
+            ignore_pk=ignore_pk,
+            ignore_timestamps=ignore_timestamps,
+        )
+    except Exception as e:
+        handle_cli_error(e, verbose=verbose)
+        sys.exit(1)
 
-        # Read input file
-        if verbose:
-            click.echo("Parsing SQL file...", err=True)
 
-        sql_content = input_file.read_text()
+def run(
+    input_file: Path | str,
+    output: Optional[str] = None,
+    verbose: bool = False,
+    interactive: bool = False,
+    ignore_pk: bool = False,
+    ignore_timestamps: bool = False,
+    stdout: Optional[TextIO] = None,
+) -> None:
+    """
+    Classify the tables in input_file and emit the TOML configuration.
 
-        # Parse SQL - captures annotated objects and all unmarked tables
-        sql_parser = SQLParser(
-            ignore_pk=ignore_pk, ignore_timestamps=ignore_timestamps
+    This is the body of the CLI without Click's argument parsing, so it can
+    be called directly. Output goes to the output file, or to stdout (or the
+    given stdout stream); progress messages go to stderr when verbose.
+
+    Raises:
+        ValueError: If no tables could be classified
+    """
+    input_file = Path(input_file)
+
+    # Validate file extension
+    if input_file.suffix != ".sql":
+        click.secho(
+            "Warning: File does not have .sql extension",
+            fg="yellow",
+            file=stdout,
         )
-        parsed_objects = sql_parser.parse(sql_content)
 
-        if verbose:
-            click.echo(f"Found {len(parsed_objects)} objects", err=True)
-            for obj in parsed_objects:
-                click.echo(f"  - {obj['type']}: {obj['name']}", err=True)
+    # Read input file
+    if verbose:
+        click.echo("Parsing SQL file...", err=True)
+
+    sql_content = input_file.read_text()
+
+    # Parse SQL - captures annotated objects and all unmarked tables
+    sql_parser = SQLParser(
+        ignore_pk=ignore_pk, ignore_timestamps=ignore_timestamps
+    )
+    parsed_objects = sql_parser.parse(sql_content)
+
+    if verbose:
+        click.echo(f"Found {len(parsed_objects)} objects", err=True)
+        for obj in parsed_objects:
+            click.echo(f"  - {obj['type']}: {obj['name']}", err=True)
+
+    # Separate annotated from unmarked tables in a single pass
+    annotated_objects = []
+    unmarked_objects = []
+    for obj in parsed_objects:
+        if obj["type"] == "unmarked":
+            unmarked_objects.append(obj)
+        else:
+            annotated_objects.append(obj)
 
-        # Separate annotated from unmarked tables
-        annotated_objects = [obj for obj in parsed_objects if obj["type"] != "unmarked"]
-        unmarked_objects = [obj for obj in parsed_objects if obj["type"] == "unmarked"]
+    if verbose:
+        click.echo(
+            f"  ({len(annotated_objects)} annotated, {len(unmarked_objects)} unmarked)",
+            err=True,
+        )
 
-        if verbose:
-            click.echo(
-                f"  ({len(annotated_objects)} annotated, {len(unmarked_objects)} unmarked)",
-                err=True,
-            )
+    # Classify unmarked tables
+    classified_objects = list(annotated_objects)  # Start with annotated
 
-        # Classify unmarked tables
-        classified_objects = list(annotated_objects)  # Start with annotated
+    if unmarked_objects:
+        if interactive:
+            # Interactive mode: use existing InteractiveClassifier
+            if verbose:
+                click.echo("\nStarting interactive classification...", err=True)
 
-        if unmarked_objects:
-            if interactive:
-                # Interactive mode: use existing InteractiveClassifier
-                if verbose:
-                    click.echo("\nStarting interactive classification...", err=True)
+            classifier = InteractiveClassifier(verbose=verbose)
+            classified_objects, classified_count = classifier.classify_tables(
+                parsed_objects, skip_annotated=True
+            )
 
-                classifier = InteractiveClassifier(verbose=verbose)
-                classified_objects, classified_count = classifier.classify_tables(
-                    parsed_objects, skip_annotated=True
+            if verbose:
+                click.echo(f"Classified {classified_count} tables", err=True)
+        else:
+            # Auto mode: use heuristics to classify
+            if verbose:
+                click.echo(
+                    "\nAuto-classifying unmarked tables using heuristics...",
+                    err=True,
                 )
 
-                if verbose:
-                    click.echo(f"Classified {classified_count} tables", err=True)
-            else:
-                # Auto mode: use heuristics to classify
-                if verbose:
-                    click.echo(
-                        "\nAuto-classifying unmarked tables using heuristics...",
-                        err=True,
-                    )
+            # First analyze relationships for all objects
+            analyzer = RelationshipAnalyzer()
+            relationships = analyzer.analyze(parsed_objects)
 
-                # First analyze relationships for all objects
-                analyzer = RelationshipAnalyzer()
-                relationships = analyzer.analyze(parsed_objects)
+            # Auto-classify unmarked tables
+            auto_classifier = AutoClassifier()
+            classified_count = 0
 
-                # Auto-classify unmarked tables
-                auto_classifier = AutoClassifier()
-                classified_count = 0
+            for obj in unmarked_objects:
+                result = auto_classifier.classify(
+                    obj, relationships, verbose=verbose
+                )
+                obj["type"] = result.object_type.value
+                classified_count += 1
 
-                for obj in unmarked_objects:
-                    result = auto_classifier.classify(
-                        obj, relationships, verbose=verbose
+                if verbose and result.reasoning:
+                    click.echo(
+                        f"  {obj['name']}: {result.object_type.value} "
+                        f"(confidence: {result.confidence:.0%})",
+                        err=True,
                     )
-                    obj["type"] = result.object_type.value
-                    classified_count += 1
-
-                    if verbose and result.reasoning:
-                        click.echo(
-                            f"  {obj['name']}: {result.object_type.value} "
-                            f"(confidence: {result.confidence:.0%})",
-                            err=True,
-                        )
 
-                classified_objects = annotated_objects + unmarked_objects
+            classified_objects = annotated_objects + unmarked_objects
 
-                if verbose:
-                    click.echo(f"Auto-classified {classified_count} tables", err=True)
-        else:
             if verbose:
-                click.echo("No unmarked tables to classify", err=True)
-
-        # Filter out any remaining unmarked tables
-        filtered_objects = [
-            obj for obj in classified_objects if obj["type"] != "unmarked"
-        ]
-
-        if not filtered_objects:
-            click.secho(
-                "Error: No classified objects. Cannot generate configuration.",
-                fg="red",
-                err=True,
-            )
-            sys.exit(1)
-
-        # Generate TOML configuration using common pipeline
-        output_content = generate_toml_config(filtered_objects, [], verbose=verbose)
-
-        # Write output
-        if output:
-            output_path = Path(output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(output_content)
-            if verbose:
-                click.echo(f"Output written to {output_path}", err=True)
-        else:
-            click.echo(output_content)
-
+                click.echo(f"Auto-classified {classified_count} tables", err=True)
+    else:
         if verbose:
-            click.echo("Done!", err=True)
+            click.echo("No unmarked tables to classify", err=True)
+
+    # Filter out any remaining unmarked tables
+    filtered_objects = [
+        obj for obj in classified_objects if obj["type"] != "unmarked"
+    ]
+
+    if not filtered_objects:
+        raise ValueError("No classified objects. Cannot generate configuration.")
+
+    # Generate TOML configuration using common pipeline
+    output_content = generate_toml_config(filtered_objects, [], verbose=verbose)
+
+    # Write output
+    if output:
+        output_dir = os.path.dirname(output)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        with open(output, "w") as f:
+            f.write(output_content)
+        if verbose:
+            click.echo(f"Output written to {output}", err=True)
+    else:
+        click.echo(output_content, file=stdout)
 
-    except Exception as e:
-        handle_cli_error(e, verbose=verbose)
-        sys.exit(1)
+    if verbose:
+        click.echo("Done!", err=True)
 
 
 if __name__ == "__main__":
@@ -2,23 +2,55 @@
 SQL Parser for extracting render-engine objects (pages and collections)
 """
 
+import copy
 import re
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SQLObject:
-    """Represents a render-engine SQL object"""
+    """
+    Represents a render-engine SQL object.
+
+    Immutable (tuples instead of lists), so the parse cache can share one
+    instance between callers; to_dict() builds the mutable dict they receive.
+    """
 
     name: str
-    type: str  # 'page' or 'collection'
+    type: str  # 'page', 'collection', 'attribute', 'junction' or 'unmarked'
     table: str
-    columns: List[str]
-    attributes: Dict[str, Any]
+    columns: Tuple[str, ...]
+    attributes: Mapping[str, Any]
+
+    @classmethod
+    def from_dict(cls, obj: Dict[str, Any]) -> "SQLObject":
+        return cls(
+            name=obj["name"],
+            type=obj["type"],
+            table=obj["table"],
+            columns=tuple(obj["columns"]),
+            attributes=MappingProxyType(
+                {
+                    key: tuple(value) if isinstance(value, list) else value
+                    for key, value in obj["attributes"].items()
+                }
+            ),
+        )
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "name": self.name,
+            "type": self.type,
+            "table": self.table,
+            "columns": list(self.columns),
+            "attributes": {
+                key: list(value) if isinstance(value, tuple) else value
+                for key, value in self.attributes.items()
+            },
+        }
 
 
 class SQLParser:
@@ -36,46 +68,24 @@ class SQLParser:
         self.ignore_timestamps = ignore_timestamps
         self.primary_key_columns: Dict[str, set[str]] = {}  # Maps table names to their PK columns
 
-    # Pattern for page definitions (handles schema-qualified names like public.table_name)
-    # Syntax: -- @page [parent_name]
-    PAGE_PATTERN = re.compile(
-        r"--\s*@page(?:\s+['\"]?(\w+)['\"]?)?\s*\n\s*CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:\w+\.)?(\w+)\s*\((.*?)\);",
-        re.IGNORECASE | re.DOTALL,
-    )
-
-    # Pattern for collection definitions (collection name and parent are optional)
-    # Syntax: -- @collection [parent_name]
-    COLLECTION_PATTERN = re.compile(
-        r"--\s*@collection(?:\s+['\"]?(\w+)['\"]?)?\s*\n\s*CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:\w+\.)?(\w+)\s*\((.*?)\);",
-        re.IGNORECASE | re.DOTALL,
-    )
-
-    # Pattern for junction/relationship table definitions
-    # Syntax: -- @junction [parent_name]
-    JUNCTION_PATTERN = re.compile(
-        r"--\s*@junction(?:\s+['\"]?(\w+)['\"]?)?\s*\n\s*CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:\w+\.)?(\w+)\s*\((.*?)\);",
-        re.IGNORECASE | re.DOTALL,
-    )
-
-    # Pattern for attribute table definitions
-    # Syntax: -- @attribute [parent_name]
-    ATTRIBUTE_PATTERN = re.compile(
-        r"--\s*@attribute(?:\s+['\"]?(\w+)['\"]?)?\s*\n\s*CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:\w+\.)?(\w+)\s*\((.*?)\);",
-        re.IGNORECASE | re.DOTALL,
-    )
-
-    # Pattern for all CREATE TABLE statements (handles schema-qualified names like public.table_name)
-    ALL_TABLES_PATTERN = re.compile(
-        r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:\w+\.)?(\w+)\s*\((.*?)\);",
+    # Annotation types, in the order parse() returns them (unmarked tables last)
+    ANNOTATION_TYPES = ("page", "collection", "junction", "attribute")
+
+    # Canonical type strings keyed by the lowered annotation, so every object
+    # shares one string per type instead of a fresh str.lower() result
+    _TYPE_NAMES = {annotation_type: annotation_type for annotation_type in ANNOTATION_TYPES}
+
+    # Pattern for CREATE TABLE statements with an optional annotation comment
+    # (handles schema-qualified names like public.table_name)
+    # Syntax: -- @page|@collection|@junction|@attribute [parent_name]
+    # The body ends at the first ")" followed by ";" (whitespace allowed in
+    # between), so it can't run on into the next table's annotation
+    TABLE_PATTERN = re.compile(
+        r"(?:--\s*@(?P<annotation>page|collection|junction|attribute)(?:\s+['\"]?(?P<parent>\w+)['\"]?)?\s*\n\s*)?"
+        r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:\w+\.)?(?P<table>\w+)\s*\((?P<body>.*?)\)\s*;",
         re.IGNORECASE | re.DOTALL,
     )
 
-    # Pattern for column definitions
-    COLUMN_PATTERN = re.compile(r"(\w+)\s+([^,\)]+?)(?:,|$)", re.IGNORECASE)
-
-    # Pattern for comments
-    COMMENT_PATTERN = re.compile(r"--\s*@(\w+)\s*(.+?)(?:\n|$)")
-
     # Pattern for ALTER TABLE ... ADD CONSTRAINT ... PRIMARY KEY
     # Matches: ALTER TABLE [ONLY] [schema.]table ADD CONSTRAINT constraint_name PRIMARY KEY (col1, col2, ...);
     ALTER_TABLE_PK_PATTERN = re.compile(
@@ -83,6 +93,14 @@ class SQLParser:
         re.IGNORECASE | re.DOTALL,
     )
 
+    # Per-column annotations and constraints checked on each column line
+    IGNORE_COMMENT_PATTERN = re.compile(r"--\s*ignore", re.IGNORECASE)
+    AGGREGATE_COMMENT_PATTERN = re.compile(r"--\s*@aggregate", re.IGNORECASE)
+    UNIQUE_PATTERN = re.compile(r"\bUNIQUE\b", re.IGNORECASE)
+
+    # Leading words of table-constraint lines, which are not column names
+    CONSTRAINT_KEYWORDS = frozenset({"PRIMARY", "FOREIGN", "UNIQUE", "CHECK", "CONSTRAINT"})
+
     def _extract_primary_keys(self, sql_content: str) -> None:
         """
         Extract PRIMARY KEY columns from ALTER TABLE statements.
@@ -132,25 +150,48 @@ class SQLParser:
                     'collection_name': str (for collections)
                 }
             }
+
+        Results are cached per (sql_content, ignore_pk, ignore_timestamps), so
+        re-reading the same schema costs a copy rather than a parse. Subclasses
+        are parsed directly, since the cache always parses with SQLParser.
         """
+        if type(self) is not SQLParser:
+            return self._parse(sql_content)
+
+        objects, primary_key_columns = _parse_cached(
+            sql_content, self.ignore_pk, self.ignore_timestamps
+        )
+        self.primary_key_columns.update(copy.deepcopy(primary_key_columns))
+        # Callers (e.g. the classifiers) rewrite objects in place
+        return [obj.to_dict() for obj in objects]
+
+    def _parse(self, sql_content: str) -> List[Dict[str, Any]]:
+        """Parse SQL content without the cache; see parse()."""
         # Extract PRIMARY KEY columns from ALTER TABLE statements first
         self._extract_primary_keys(sql_content)
 
-        objects = []
-
-        # Find all pages
-        for match in self.PAGE_PATTERN.finditer(sql_content):
-            parent_name = match.group(1)
-            table_name = match.group(2)
-            columns_def = match.group(3)
-            columns, ignored_columns, aggregate_columns, unique_columns = self._parse_columns(columns_def, table_name, "page")
-
-            obj = {
+        # One scan over the file; bucket matches by annotation type so the
+        # result keeps its order of pages, collections, junctions, attributes
+        annotated: Dict[str, List[Dict[str, Any]]] = {
+            annotation_type: [] for annotation_type in self.ANNOTATION_TYPES
+        }
+        unmarked = []
+
+        for match in self.TABLE_PATTERN.finditer(sql_content):
+            annotation = match.group("annotation")
+            table_name = match.group("table")
+            table_type = self._TYPE_NAMES[annotation.lower()] if annotation else "unmarked"
+            columns, ignored_columns, aggregate_columns, unique_columns = self._parse_columns(
+                sql_content, match.start("body"), match.end("body"), table_name, table_type
+            )
+
+            obj: Dict[str, Any] = {
                 "name": table_name,
-                "type": "page",
+                "type": table_type,
                 "table": table_name,
                 "columns": columns,
-                "attributes": {},
+                # Collection name defaults to table name
+                "attributes": {"collection_name": table_name} if table_type == "collection" else {},
             }
             if ignored_columns:
                 obj["attributes"]["ignored_columns"] = ignored_columns
@@ -158,123 +199,35 @@ class SQLParser:
                 obj["attributes"]["aggregate_columns"] = aggregate_columns
             if unique_columns:
                 obj["attributes"]["unique_columns"] = unique_columns
-            if parent_name:
-                obj["attributes"]["parent_collection"] = parent_name
-            objects.append(obj)
-
-        # Find all collections
-        for match in self.COLLECTION_PATTERN.finditer(sql_content):
-            parent_name = match.group(1)  # Optional parent collection name
-            table_name = match.group(2)
-            columns_def = match.group(3)
-            columns, ignored_columns, aggregate_columns, unique_columns = self._parse_columns(columns_def, table_name, "collection")
-
-            # Collection name defaults to table name
-            collection_name = table_name
-
-            obj = {
-                "name": collection_name,
-                "type": "collection",
-                "table": table_name,
-                "columns": columns,
-                "attributes": {"collection_name": collection_name},
-            }
-            if ignored_columns:
-                obj["attributes"]["ignored_columns"] = ignored_columns
-            if aggregate_columns:
-                obj["attributes"]["aggregate_columns"] = aggregate_columns
-            if unique_columns:
-                obj["attributes"]["unique_columns"] = unique_columns
-            if parent_name:
-                obj["attributes"]["parent_collection"] = parent_name
-            objects.append(obj)
-
-        # Find all junction tables
-        for match in self.JUNCTION_PATTERN.finditer(sql_content):
-            parent_name = match.group(1)
-            table_name = match.group(2)
-            columns_def = match.group(3)
-            columns, ignored_columns, aggregate_columns, unique_columns = self._parse_columns(columns_def, table_name, "junction")
-
-            obj = {
-                "name": table_name,
-                "type": "junction",
-                "table": table_name,
-                "columns": columns,
-                "attributes": {},
-            }
-            if ignored_columns:
-                obj["attributes"]["ignored_columns"] = ignored_columns
-            if aggregate_columns:
-                obj["attributes"]["aggregate_columns"] = aggregate_columns
-            if unique_columns:
-                obj["attributes"]["unique_columns"] = unique_columns
-            if parent_name:
-                obj["attributes"]["parent_collection"] = parent_name
-            objects.append(obj)
-
-        # Find all attribute tables
-        for match in self.ATTRIBUTE_PATTERN.finditer(sql_content):
-            parent_name = match.group(1)
-            table_name = match.group(2)
-            columns_def = match.group(3)
-            columns, ignored_columns, aggregate_columns, unique_columns = self._parse_columns(columns_def, table_name, "attribute")
-
-            obj = {
-                "name": table_name,
-                "type": "attribute",
-                "table": table_name,
-                "columns": columns,
-                "attributes": {},
-            }
-            if ignored_columns:
-                obj["attributes"]["ignored_columns"] = ignored_columns
-            if aggregate_columns:
-                obj["attributes"]["aggregate_columns"] = aggregate_columns
-            if unique_columns:
-                obj["attributes"]["unique_columns"] = unique_columns
-            if parent_name:
-                obj["attributes"]["parent_collection"] = parent_name
-            objects.append(obj)
-
-        # Find unmarked tables and add them as untyped/inferred tables
-        # Keep track of tables we've already processed
-        processed_tables = {obj["table"] for obj in objects}
-
-        for match in self.ALL_TABLES_PATTERN.finditer(sql_content):
-            table_name = match.group(1)
-            columns_def = match.group(2)
 
-            # Skip if we already parsed this table
-            if table_name in processed_tables:
-                continue
+            if annotation:
+                parent_name = match.group("parent")
+                if parent_name:
+                    obj["attributes"]["parent_collection"] = parent_name
+                annotated[table_type].append(obj)
+            else:
+                # Add as unmarked table (will be inferred from usage in junctions)
+                unmarked.append(obj)
 
-            columns, ignored_columns, aggregate_columns, unique_columns = self._parse_columns(columns_def, table_name, "unmarked")
+        objects = [obj for bucket in annotated.values() for obj in bucket]
 
-            # Add as unmarked table (will be inferred from usage in junctions)
-            obj = {
-                "name": table_name,
-                "type": "unmarked",
-                "table": table_name,
-                "columns": columns,
-                "attributes": {},
-            }
-            if ignored_columns:
-                obj["attributes"]["ignored_columns"] = ignored_columns
-            if aggregate_columns:
-                obj["attributes"]["aggregate_columns"] = aggregate_columns
-            if unique_columns:
-                obj["attributes"]["unique_columns"] = unique_columns
-            objects.append(obj)
+        # Skip unmarked tables that are also defined with an annotation
+        if unmarked:
+            processed_tables = {obj["table"] for obj in objects}
+            objects.extend(obj for obj in unmarked if obj["table"] not in processed_tables)
 
         return objects
 
-    def _parse_columns(self, columns_def: str, table_name: str = "", table_type: str = "") -> tuple:
+    def _parse_columns(
+        self, sql_content: str, start: int, end: int, table_name: str = "", table_type: str = ""
+    ) -> tuple:
         """
         Extract column names from column definitions.
 
         Args:
-            columns_def: The column definitions string from CREATE TABLE
+            sql_content: The SQL file content as a string
+            start: Offset of the column definitions in sql_content (inside CREATE TABLE's parentheses)
+            end: Offset just past the column definitions
             table_name: The table name (used to look up PRIMARY KEY columns from ALTER TABLE statements)
             table_type: The type of table ('page', 'collection', 'attribute', 'junction', 'unmarked')
 
@@ -285,7 +238,8 @@ class SQLParser:
             - aggregate_columns: List of column names marked with @aggregate comment
             - unique_columns: List of column names with UNIQUE constraint
         """
-        columns = []
+        # Insertion-ordered dict as an ordered set: O(1) duplicate checks
+        columns: Dict[str, None] = {}
         ignored_columns = []
         aggregate_columns = []
         unique_columns = []
@@ -293,40 +247,46 @@ class SQLParser:
         # Get PRIMARY KEY columns for this table (from ALTER TABLE statements)
         pk_columns = self.primary_key_columns.get(table_name, set())
 
-        # Split by lines to parse each column definition
+        # Walk the definitions line by line to parse each column definition
         # This handles -- ignore and @aggregate comments that appear on the same line as the column
-        lines = columns_def.split('\n')
-
-        for line in lines:
-            line_stripped = line.strip()
+        # Lines are sliced straight out of sql_content by offset, so the
+        # table body is never copied or split into a list as a whole
+        line_start = start
+        while line_start < end:
+            line_end = sql_content.find('\n', line_start, end)
+            if line_end == -1:
+                line_end = end
+            line_stripped = sql_content[line_start:line_end].strip()
+            line_start = line_end + 1
 
             # Skip empty lines and comment-only lines
             if not line_stripped or line_stripped.startswith('--'):
                 continue
 
-            # Remove trailing comma for processing
-            line_for_parsing = line_stripped.rstrip(',').strip()
+            # Split off the trailing comment, if any
+            col_def, comment_marker, _ = line_stripped.partition('--')
 
-            # Check for annotations in the comment
-            has_ignore = bool(re.search(r'--\s*ignore', line_stripped, re.IGNORECASE))
-            has_aggregate = bool(re.search(r'--\s*@aggregate', line_stripped, re.IGNORECASE))
-            has_unique = bool(re.search(r'\bUNIQUE\b', line_stripped, re.IGNORECASE))
+            line_upper = line_stripped.upper()
 
-            # Remove the comment part for parsing
-            col_def_no_comment = line_for_parsing.split('--')[0] if '--' in line_for_parsing else line_for_parsing
+            # Check for annotations in the comment; cheap substring tests
+            # skip the regexes on the common line with no comment or UNIQUE
+            has_comment = bool(comment_marker)
+            has_ignore = has_comment and bool(self.IGNORE_COMMENT_PATTERN.search(line_stripped))
+            has_aggregate = has_comment and bool(self.AGGREGATE_COMMENT_PATTERN.search(line_stripped))
+            has_unique = 'UNIQUE' in line_upper and bool(self.UNIQUE_PATTERN.search(line_stripped))
 
-            # Remove parentheses and extra whitespace
-            col_def_no_comment = col_def_no_comment.strip().strip('()')
+            # Remove the trailing comma, parentheses and extra whitespace
+            col_def = col_def.rstrip().rstrip(',').strip().strip('()')
 
             # Extract the first word as the column name (ignore constraints)
-            words = col_def_no_comment.split()
+            words = col_def.split(maxsplit=1)
             if words:
-                col_name = words[0].strip()
+                col_name = words[0]
                 # Skip constraint keywords and empty names
-                if col_name and col_name.upper() not in ('PRIMARY', 'FOREIGN', 'UNIQUE', 'CHECK', 'CONSTRAINT'):
+                if col_name and col_name.upper() not in self.CONSTRAINT_KEYWORDS:
                     # Avoid duplicate column names
                     if col_name not in columns:
-                        columns.append(col_name)
+                        columns[col_name] = None
 
                         # Check if column should be ignored
                         should_ignore = has_ignore
@@ -336,7 +296,7 @@ class SQLParser:
                         is_junction = table_type == "junction"
 
                         # Check for PRIMARY KEY (inline in column definition)
-                        if self.ignore_pk and not is_junction and 'PRIMARY KEY' in line_stripped.upper():
+                        if self.ignore_pk and not is_junction and 'PRIMARY KEY' in line_upper:
                             should_ignore = True
 
                         # Check for PRIMARY KEY (from ALTER TABLE statement)
@@ -344,7 +304,7 @@ class SQLParser:
                             should_ignore = True
 
                         # Check for TIMESTAMP
-                        if self.ignore_timestamps and 'TIMESTAMP' in line_stripped.upper():
+                        if self.ignore_timestamps and 'TIMESTAMP' in line_upper:
                             should_ignore = True
 
                         if should_ignore:
@@ -358,4 +318,20 @@ class SQLParser:
                         if has_unique:
                             unique_columns.append(col_name)
 
-        return columns, ignored_columns, aggregate_columns, unique_columns
+        return list(columns), ignored_columns, aggregate_columns, unique_columns
+
+
+@lru_cache(maxsize=256)
+def _parse_cached(
+    sql_content: str, ignore_pk: bool, ignore_timestamps: bool
+) -> tuple[tuple[SQLObject, ...], Dict[str, set[str]]]:
+    """
+    Parse a schema once per (content, flags) with a fresh SQLParser.
+
+    Returns the parsed objects and the PRIMARY KEY columns found in ALTER
+    TABLE statements. Both are shared by every caller: the objects are
+    frozen, but the PRIMARY KEY sets must be copied before use.
+    """
+    parser = SQLParser(ignore_pk=ignore_pk, ignore_timestamps=ignore_timestamps)
+    objects = parser._parse(sql_content)
+    return tuple(SQLObject.from_dict(obj) for obj in objects), parser.primary_key_columns
@@ -1,4 +1,4 @@
-from typing import NamedTuple
+from typing import Literal, NamedTuple
 from psycopg import Connection
 from typing import Optional
 
@@ -11,15 +11,25 @@ def get_db_connection(
     database: Optional[str] = None,
     user: Optional[str] = None,
     password: Optional[str] = None,
+    prepare_threshold: Optional[int] = 1,
 ) -> Connection:
     """
     Connection factory (keyword-only arguments).
 
     Can use either connection_string OR individual params.
     Returns a Connection for use with context manager.
+
+    prepare_threshold controls how many times a query must run before psycopg
+    prepares it server-side. The default of 1 (psycopg's own default is 5)
+    prepares repeated page and insert queries right away; pass None to disable
+    prepared statements, which PgBouncer in transaction pooling mode requires.
     """
     if connection_string:
-        return Connection.connect(connection_string, autocommit=True)
+        return Connection.connect(
+            connection_string,
+            autocommit=True,
+            prepare_threshold=prepare_threshold,
+        )
     else:
         return Connection.connect(
             host=host,
@@ -28,6 +38,7 @@ def get_db_connection(
             user=user,
             password=password,
             autocommit=True,
+            prepare_threshold=prepare_threshold,
         )
 
 
@@ -40,8 +51,17 @@ class PostgresQuery(NamedTuple):
        - The query will be loaded from pyproject.toml [tool.render-engine.pg].read_sql
 
     Explicit query takes precedence if both are provided.
+
+    Set stream=True for large result sets: rows are then fetched in batches
+    through a server-side cursor instead of being buffered all at once.
+
+    Set expected_rows="one" for queries that return a single row (e.g.
+    WHERE id = ...): the row is fetched with fetchone() and its columns
+    become the page attributes directly, instead of a one-item "data" list.
     """
 
     connection: Connection
     query: Optional[str] = None
     collection_name: Optional[str] = None
+    stream: bool = False
+    expected_rows: Literal["one", "many", "auto"] = "auto"
@@ -1,10 +1,16 @@
 import frontmatter
 import re
+import string
 import logging
 from datetime import datetime
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import Generator, Iterable, Optional, Any
+from typing import Generator, Iterable, Iterator, NamedTuple, Optional, Any
 from psycopg import sql
+from psycopg.pq import TransactionStatus
 from psycopg.rows import class_row
 from render_engine.content_managers import ContentManager
 from render_engine_markdown import MarkdownPageParser
@@ -15,6 +21,128 @@ from render_engine_pg.re_settings_parser import PGSettings
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_settings() -> PGSettings:
+    """
+    Load plugin settings once for the ingest path.
+
+    create_entry_static runs once per markdown file; re-reading pyproject.toml
+    for every entry dominates bulk ingestion. Call _get_settings.cache_clear()
+    to pick up configuration changes.
+    """
+    return PGSettings()
+
+
+@lru_cache(maxsize=128)
+def _compile_insert(table: str, columns: tuple[str, ...]) -> sql.Composed:
+    """
+    Build the INSERT statement for a table and column set.
+
+    Entries in a collection usually share one frontmatter schema, so the
+    composed statement is built (and its identifiers validated) once per
+    process rather than once per entry.
+    """
+    return sql.SQL("INSERT INTO {} ({}) VALUES ({})").format(
+        sql.Identifier(table),
+        sql.SQL(", ").join(map(sql.Identifier, columns)),
+        sql.SQL(", ").join(sql.Placeholder() * len(columns)),
+    )
+
+
+@lru_cache(maxsize=128)
+def _allowed_columns(read_sql: str) -> Optional[frozenset[str]]:
+    """
+    Extract the column names selected by a collection's read_sql.
+
+    Only frontmatter keys in this set are inserted. The read_sql is the same
+    for every entry in a collection, so it is parsed once per process.
+    """
+    select_match = re.search(
+        r"SELECT\s+(?:DISTINCT\s+ON\s+\([^)]+\)\s+)?(.+?)\s+FROM",
+        read_sql,
+        re.IGNORECASE,
+    )
+    if not select_match:
+        return None
+
+    col_names = []
+    for col in select_match.group(1).split(","):
+        col = col.strip()
+        if " as " in col.lower():
+            col = col.split(" as ")[-1].strip()
+        if "." in col:
+            col = col.split(".")[-1].strip()
+        col_names.append(col)
+    return frozenset(col_names)
+
+
+class _PreparedEntry(NamedTuple):
+    """An entry whose pre-main templates ran and whose main INSERT is pending."""
+
+    insert_query: sql.Composed
+    values: tuple[Any, ...]
+    frontmatter_data: dict[str, Any]
+    post_main_templates: list[str]
+
+
+@lru_cache(maxsize=256)
+def _parse_template(template: str) -> tuple[str, tuple[str, ...]]:
+    """
+    Rewrite {name} placeholders to %(name)s and list the fields they need.
+
+    Templates come from settings and repeat for every entry, so each one is
+    parsed once per process.
+    """
+    parts = []
+    field_names = []
+    for literal, field_name, _, _ in string.Formatter().parse(template):
+        parts.append(literal.replace("%", "%%"))
+        if field_name:
+            parts.append(f"%({field_name})s")
+            if field_name not in field_names:
+                field_names.append(field_name)
+    return "".join(parts), tuple(field_names)
+
+
+@contextmanager
+def _transaction(connection: Any) -> Iterator[None]:
+    """
+    Run a block in one explicit transaction and commit once at the end.
+
+    Autocommit is switched off for the duration of the block and restored
+    afterwards; any error rolls back everything executed inside the block.
+
+    If the caller already has a transaction open (e.g. inside
+    `with connection.transaction():`), the block runs in a savepoint
+    instead and the commit is left to the caller.
+    """
+    if connection.info.transaction_status != TransactionStatus.IDLE:
+        with connection.transaction():
+            yield
+        return
+
+    original_autocommit = connection.autocommit
+    try:
+        connection.autocommit = False
+        yield
+        connection.commit()
+    except Exception:
+        try:
+            connection.rollback()
+        except Exception:
+            pass
+        raise
+    finally:
+        try:
+            connection.autocommit = original_autocommit
+        except Exception:
+            try:
+                connection.rollback()
+                connection.autocommit = original_autocommit
+            except Exception:
+                pass
+
+
 class PostgresContentManager(ContentManager):
     """ContentManager for Collections - yields multiple Page objects"""
 
@@ -100,34 +228,21 @@ class PostgresContentManager(ContentManager):
     def _convert_template_to_parameterized(
         template: str,
         data: dict[str, Any],
-    ) -> tuple[str, list[Any]]:
-        """
-        Convert a {placeholder} template to a parameterized query with %s placeholders.
+    ) -> tuple[str, dict[str, Any]]:
         """
-        import string
+        Convert a {placeholder} template to a query with %(name)s placeholders.
 
-        formatter = string.Formatter()
-        field_names = [
-            field_name
-            for _, field_name, _, _ in formatter.parse(template)
-            if field_name
-        ]
+        The frontmatter data is returned as-is to be bound as named
+        parameters; psycopg only reads the keys the query references.
+        """
+        param_query, field_names = _parse_template(template)
 
         # Check if all required fields are available
         for field in field_names:
             if field not in data:
                 raise KeyError(field)
 
-        # Build parameterized query by replacing {key} with %s
-        # and collecting values in order of appearance
-        param_query = template
-        values = []
-        for _, field_name, _, _ in formatter.parse(template):
-            if field_name:
-                param_query = param_query.replace(f"{{{field_name}}}", "%s", 1)
-                values.append(data[field_name])
-
-        return param_query, values
+        return param_query, data
 
     @staticmethod
     def _execute_templates_in_order(
@@ -176,15 +291,13 @@ class PostgresContentManager(ContentManager):
 
             try:
                 # Convert template to parameterized query for safe value substitution
-                param_query, values = (
+                param_query, params = (
                     PostgresContentManager._convert_template_to_parameterized(
                         insert_sql_template, frontmatter_data
                     )
                 )
-                logger.debug(
-                    f"Executing {phase} template: {param_query} with values {values}"
-                )
-                cursor.execute(param_query, values)
+                logger.debug(f"Executing {phase} template: {param_query}")
+                cursor.execute(param_query, params)
             except KeyError as e:
                 # Rollback this specific query
                 cursor.execute(f"ROLLBACK TO SAVEPOINT {savepoint_name}")
@@ -247,179 +360,224 @@ class PostgresContentManager(ContentManager):
             if not list_items:
                 continue
 
+            param_query = None
+            params_seq = []
             for item in list_items:
                 test_data = {**frontmatter_data, missing_field: item}
 
                 try:
-                    param_query, values = (
+                    param_query, params = (
                         PostgresContentManager._convert_template_to_parameterized(
                             template, test_data
                         )
                     )
-
-                    logger.debug(
-                        f"Executing insert_sql template with list iteration (field='{list_field_name}', item='{item}'): {param_query} with values {values}"
-                    )
-                    cursor.execute(param_query, values)
                 except KeyError:
                     continue
+                params_seq.append(params)
+
+            if param_query is not None:
+                logger.debug(
+                    f"Executing insert_sql template with list iteration (field='{list_field_name}', items={len(params_seq)}): {param_query}"
+                )
+                # executemany pipelines the per-item statements instead of
+                # paying one round trip per list item
+                cursor.executemany(param_query, params_seq)
 
             return True
 
         return False
 
     @staticmethod
-    def create_entry_static(
-        content: str = "Hello World",
-        connection: Optional[Any] = None,
+    def _prepare_entry(
+        cursor: Optional[Any],
+        content: str,
         table: Optional[str] = None,
         collection_name: Optional[str] = None,
         **kwargs: Any,
-    ) -> str:
-        """
-        Static implementation of create_entry for use by CLI or instance method.
+    ) -> _PreparedEntry:
         """
-        # Parse markdown with frontmatter first to get context for template substitution
-        post = frontmatter.loads(content)
+        Run an entry's pre-main insert_sql templates and build its main INSERT.
 
-        # Add any additional kwargs to the frontmatter
-        for key, val in kwargs.items():
-            if key not in ("connection", "table", "collection_name"):
-                post[key] = val
+        Everything runs on the given cursor and nothing is committed; callers
+        share one cursor across a _transaction(). With no cursor, only the
+        INSERT statement is built.
+        """
+        # Parse markdown with frontmatter first to get context for template substitution.
+        # frontmatter.parse returns plain (metadata, content) without building a
+        # Post; YAML is loaded with libyaml's CSafeLoader when it is installed.
+        frontmatter_data, markdown_content = frontmatter.parse(content)
 
-        # Combine frontmatter and content
-        frontmatter_data = post.metadata
-        markdown_content = post.content
+        # Add any additional kwargs to the frontmatter. connection, table and
+        # collection_name are named parameters, so they never land in kwargs.
+        frontmatter_data.update(kwargs)
 
         # Add the markdown content to the data if not already present
-        if "content" not in frontmatter_data:
-            frontmatter_data["content"] = markdown_content
+        frontmatter_data.setdefault("content", markdown_content)
 
-        if "slug" not in frontmatter_data:
-            pass
+        if table is None:
+            # Fallback if no table provided (should usually be provided)
+            # This is a bit risky if called statically without context
+            if collection_name:
+                table = collection_name
+            else:
+                raise ValueError("Table name is required for insertion.")
 
         post_main_templates: list[str] = []
+        allowed_columns = None
 
         if collection_name:
-            settings = PGSettings()
+            settings = _get_settings()
             insert_sql_list = settings.get_insert_sql(collection_name)
 
-            if insert_sql_list and connection:
+            if insert_sql_list and cursor:
                 if "created_at" not in frontmatter_data:
                     frontmatter_data["created_at"] = datetime.now().isoformat()
 
                 if "updated_at" not in frontmatter_data:
                     frontmatter_data["updated_at"] = datetime.now().isoformat()
 
-                original_autocommit = connection.autocommit
-                try:
-                    connection.autocommit = False
-
-                    with connection.cursor() as cur:
-                        post_main_templates = (
-                            PostgresContentManager._execute_templates_in_order(
-                                cur, connection, insert_sql_list, frontmatter_data
-                            )
-                        )
+                post_main_templates = (
+                    PostgresContentManager._execute_templates_in_order(
+                        cursor, cursor.connection, insert_sql_list, frontmatter_data
+                    )
+                )
 
-                    connection.commit()
-                except Exception:
-                    try:
-                        connection.rollback()
-                    except Exception:
-                        pass
-                    raise
-                finally:
-                    try:
-                        connection.autocommit = original_autocommit
-                    except Exception:
-                        try:
-                            connection.rollback()
-                            connection.autocommit = original_autocommit
-                        except Exception:
-                            pass
-
-        # Extract allowed columns from read_sql configuration
-        allowed_columns = None
-        if collection_name:
-            settings = PGSettings()
+            # Extract allowed columns from read_sql configuration
             read_sql = settings.get_read_sql(collection_name)
             if read_sql and isinstance(read_sql, str):
-                select_match = re.search(
-                    r"SELECT\s+(?:DISTINCT\s+ON\s+\([^)]+\)\s+)?(.+?)\s+FROM",
-                    read_sql,
-                    re.IGNORECASE,
-                )
-                if select_match:
-                    select_clause = select_match.group(1)
-                    col_names = []
-                    for col in select_clause.split(","):
-                        col = col.strip()
-                        if " as " in col.lower():
-                            col = col.split(" as ")[-1].strip()
-                        if "." in col:
-                            col = col.split(".")[-1].strip()
-                        col_names.append(col)
-                    allowed_columns = set(col_names)
+                allowed_columns = _allowed_columns(read_sql)
 
         if allowed_columns:
-            filtered_data = {
-                k: v for k, v in frontmatter_data.items() if k in allowed_columns
-            }
+            items = [
+                (k, v) for k, v in frontmatter_data.items() if k in allowed_columns
+            ]
         else:
-            filtered_data = frontmatter_data
-
-        columns = list(filtered_data.keys())
-        values = list(filtered_data.values())
+            items = list(frontmatter_data.items())
+
+        # Split column names and values in one pass over the data
+        columns: tuple[str, ...] = ()
+        values: tuple[Any, ...] = ()
+        if items:
+            columns, values = zip(*items)
+
+        return _PreparedEntry(
+            insert_query=_compile_insert(table.casefold(), columns),
+            values=values,
+            frontmatter_data=frontmatter_data,
+            post_main_templates=post_main_templates,
+        )
 
-        if table is None:
-            # Fallback if no table provided (should usually be provided)
-            # This is a bit risky if called statically without context
-            if collection_name:
-                table = collection_name
-            else:
-                raise ValueError("Table name is required for insertion.")
+    @staticmethod
+    def _execute_post_main(cursor: Any, entry: _PreparedEntry) -> None:
+        """Run an entry's post-main (junction) templates after its main INSERT."""
+        if entry.post_main_templates:
+            PostgresContentManager._execute_template_list(
+                cursor, entry.post_main_templates, entry.frontmatter_data, "post-main"
+            )
 
-        insert_query = sql.SQL("INSERT INTO {} ({}) VALUES ({})").format(
-            sql.Identifier(str(table.casefold())),
-            sql.SQL(", ").join(map(sql.Identifier, columns)),
-            sql.SQL(", ").join(sql.Placeholder() * len(values)),
+    @staticmethod
+    def _insert_entry(
+        cursor: Optional[Any],
+        content: str,
+        table: Optional[str] = None,
+        collection_name: Optional[str] = None,
+        **kwargs: Any,
+    ) -> sql.Composed:
+        """
+        Run the insert_sql templates and main INSERT for a single entry.
+        """
+        entry = PostgresContentManager._prepare_entry(
+            cursor, content, table, collection_name, **kwargs
         )
 
-        if connection:
-            original_autocommit = connection.autocommit
-            try:
-                connection.autocommit = False
+        if cursor:
+            cursor.execute(entry.insert_query, entry.values, prepare=True)
+            PostgresContentManager._execute_post_main(cursor, entry)
 
-                with connection.cursor() as cur:
-                    cur.execute(insert_query, values)
+        return entry.insert_query
 
-                    if post_main_templates:
-                        PostgresContentManager._execute_template_list(
-                            cur, post_main_templates, frontmatter_data, "post-main"
-                        )
+    @staticmethod
+    def create_entry_static(
+        content: str = "Hello World",
+        connection: Optional[Any] = None,
+        table: Optional[str] = None,
+        collection_name: Optional[str] = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Static implementation of create_entry for use by CLI or instance method.
+        """
+        if not connection:
+            return str(
+                PostgresContentManager._insert_entry(
+                    None, content, table, collection_name, **kwargs
+                )
+            )
 
-                connection.commit()
-            except Exception:
-                try:
-                    connection.rollback()
-                except Exception:
-                    pass
-                raise
-            finally:
-                try:
-                    connection.autocommit = original_autocommit
-                except Exception:
-                    try:
-                        connection.rollback()
-                        connection.autocommit = original_autocommit
-                    except Exception:
-                        pass
+        with _transaction(connection), connection.cursor() as cur:
+            insert_query = PostgresContentManager._insert_entry(
+                cur, content, table, collection_name, **kwargs
+            )
+
+        result = insert_query.as_string(connection)
+        return str(result)
+
+    @staticmethod
+    def bulk_create_entries(
+        contents: Iterable[str],
+        connection: Optional[Any] = None,
+        table: Optional[str] = None,
+        collection_name: Optional[str] = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        """
+        Create one entry per markdown string inside a single transaction.
+
+        Behaves like calling create_entry_static for each entry, but commits
+        once at the end instead of once per entry. If any entry fails, the
+        whole batch is rolled back. Called inside the caller's own open
+        transaction, the batch runs in a savepoint and nothing is committed.
+
+        All pre-main templates run first, then the main INSERTs, then the
+        post-main (junction) templates. Consecutive entries with the same
+        columns are sent with one executemany: a single Parse, N Binds.
+        """
+        if not connection:
+            return [
+                str(
+                    PostgresContentManager._prepare_entry(
+                        None, content, table, collection_name, **kwargs
+                    ).insert_query
+                )
+                for content in contents
+            ]
+
+        with _transaction(connection), connection.cursor() as cur:
+            entries = [
+                PostgresContentManager._prepare_entry(
+                    cur, content, table, collection_name, **kwargs
+                )
+                for content in contents
+            ]
+
+            for insert_query, run in groupby(entries, key=attrgetter("insert_query")):
+                cur.executemany(insert_query, [entry.values for entry in run])
 
-            result = insert_query.as_string(connection)
-            return str(result)
+            for entry in entries:
+                PostgresContentManager._execute_post_main(cur, entry)
 
-        return str(insert_query)
+        insert_queries = [entry.insert_query for entry in entries]
+
+        # Entries sharing a column set share one cached statement (see
+        # _compile_insert), so render each distinct statement only once.
+        rendered: dict[int, str] = {}
+        results = []
+        for query in insert_queries:
+            text = rendered.get(id(query))
+            if text is None:
+                text = rendered[id(query)] = str(query.as_string(connection))
+            results.append(text)
+        return results
 
     def create_entry(
         self,
@@ -471,16 +629,13 @@ class PostgresContentManager(ContentManager):
         pass
 
     @staticmethod
-    def populate_from_file(
+    def _read_markdown_file(
         file_path: str | Path,
-        connection: Any,
-        collection_name: str,
-        table: str,
         extract_slug_from_filename: bool = True,
         **extra_metadata: Any,
     ) -> str:
         """
-        Read a markdown file, extract metadata, and populate database.
+        Read a markdown file and fill in slug and extra metadata defaults.
         """
         file_path = Path(file_path)
         content = file_path.read_text()
@@ -496,7 +651,23 @@ class PostgresContentManager(ContentManager):
             if key not in post.metadata:
                 post.metadata[key] = value
 
-        updated_content = frontmatter.dumps(post)
+        return frontmatter.dumps(post)
+
+    @staticmethod
+    def populate_from_file(
+        file_path: str | Path,
+        connection: Any,
+        collection_name: str,
+        table: str,
+        extract_slug_from_filename: bool = True,
+        **extra_metadata: Any,
+    ) -> str:
+        """
+        Read a markdown file, extract metadata, and populate database.
+        """
+        updated_content = PostgresContentManager._read_markdown_file(
+            file_path, extract_slug_from_filename, **extra_metadata
+        )
 
         return PostgresContentManager.create_entry_static(
             content=updated_content,
@@ -517,20 +688,25 @@ class PostgresContentManager(ContentManager):
     ) -> list[str]:
         """
         Populate database from all markdown files in a directory.
+
+        Every matching file is read into memory first and then inserted
+        through bulk_create_entries in a single transaction: one bad file
+        (e.g. a duplicate key) rolls back the whole directory and nothing
+        is committed. To commit files independently and skip failures, call
+        populate_from_file per file instead, as the populate CLI does.
         """
         directory = Path(directory)
-        results = []
-
-        for file_path in sorted(directory.glob(pattern)):
-            if file_path.is_file():
-                result = PostgresContentManager.populate_from_file(
-                    file_path=file_path,
-                    connection=connection,
-                    collection_name=collection_name,
-                    table=table,
-                    extract_slug_from_filename=extract_slug_from_filename,
-                    **shared_metadata,
-                )
-                results.append(result)
+        contents = [
+            PostgresContentManager._read_markdown_file(
+                file_path, extract_slug_from_filename, **shared_metadata
+            )
+            for file_path in sorted(directory.glob(pattern))
+            if file_path.is_file()
+        ]
 
-        return results
+        return PostgresContentManager.bulk_create_entries(
+            contents,
+            connection=connection,
+            collection_name=collection_name,
+            table=table,
+        )
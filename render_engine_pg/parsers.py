@@ -3,6 +3,9 @@ from render_engine_pg.connection import PostgresQuery
 from render_engine_pg.re_settings_parser import PGSettings
 from psycopg.rows import dict_row
 
+# Rows fetched per round trip when streaming through a server-side cursor
+STREAM_ITERSIZE = 2000
+
 
 class PGPageParser(BasePageParser):
     @staticmethod
@@ -23,8 +26,40 @@ class PGPageParser(BasePageParser):
                     "PostgresQuery must have a query or valid collection_name"
                 )
 
+            if content_path.expected_rows == "one":
+                return PGPageParser._fetch_one(content_path.connection, query)
+
+            if content_path.stream:
+                return PGPageParser._stream_content(content_path.connection, query)
+
             with content_path.connection.cursor(row_factory=dict_row) as cursor:
-                cursor.execute(query)
+                # The same query runs once per page render; prepare it so the
+                # server reuses the plan instead of re-planning every call.
+                cursor.execute(query, prepare=True)
                 return PGPageParser.parse_content(cursor.fetchall())
 
         return BasePageParser.parse_content_path(content_path)
+
+    @staticmethod
+    def _fetch_one(connection, query):
+        """Fetch a single row and use its columns as the page attributes."""
+        with connection.cursor(row_factory=dict_row) as cursor:
+            cursor.execute(query, prepare=True)
+            row = cursor.fetchone()
+            return (dict(row) if row else {}), None
+
+    @staticmethod
+    def _stream_content(connection, query):
+        """Fetch rows in STREAM_ITERSIZE batches via a server-side cursor.
+
+        Only one batch is buffered by libpq at a time, so peak memory no longer
+        holds the raw result set alongside the rows built from it.
+        """
+        # Named cursors only live inside a transaction, even in autocommit mode
+        with connection.transaction():
+            with connection.cursor(
+                name="pg_parser_stream", row_factory=dict_row
+            ) as cursor:
+                cursor.itersize = STREAM_ITERSIZE
+                cursor.execute(query)
+                return PGPageParser.parse_content(list(cursor))
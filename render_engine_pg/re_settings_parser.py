@@ -1,12 +1,64 @@
 """Settings parser for render-engine PostgreSQL plugin."""
 
+import copy
 import logging
-import tomllib
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
+
+import tomllib
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=64)
+def _load_toml(path_str: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    """
+    Read and parse a TOML file once per (path, mtime, size).
+
+    PGSettings is built repeatedly against the same pyproject.toml; editing
+    the file changes its stat key, so a stale parse is never returned. The
+    result is shared by every caller: the top level is read-only, but nested
+    tables are not, so PGSettings deep-copies the section it keeps.
+    """
+    with open(path_str, "rb") as f:
+        return MappingProxyType(tomllib.load(f))
+
+
+@lru_cache(maxsize=32)
+def _search_pyproject_toml(start: str) -> Path:
+    """
+    Search up from an absolute start directory for pyproject.toml.
+
+    Cached per start directory, so every PGSettings() from the same cwd
+    reuses one search. Raises FileNotFoundError when nothing is found;
+    lru_cache doesn't cache exceptions, so a pyproject.toml created later
+    is still picked up by the next search.
+    """
+    current = Path(start)
+
+    # Search up the directory tree
+    for _ in range(10):  # Limit search depth
+        pyproject = current / "pyproject.toml"
+        if pyproject.exists():
+            logger.debug(f"Found pyproject.toml at {pyproject}")
+            return pyproject
+        if current.parent == current:  # Reached root
+            break
+        current = current.parent
+
+    raise FileNotFoundError(start)
+
+
+def _find_pyproject_toml_from(start: str) -> Path | None:
+    """Find pyproject.toml above an absolute start directory, or None."""
+    try:
+        return _search_pyproject_toml(start)
+    except FileNotFoundError:
+        logger.warning("Could not find pyproject.toml")
+        return None
+
 
 class PGSettings:
     """
@@ -36,20 +88,9 @@ class PGSettings:
     @staticmethod
     def _find_pyproject_toml(start_path: Path | None = None) -> Path | None:
         """Find pyproject.toml by searching up from start_path or current directory."""
-        current = Path(start_path or ".").resolve()
-
-        # Search up the directory tree
-        for _ in range(10):  # Limit search depth
-            pyproject = current / "pyproject.toml"
-            if pyproject.exists():
-                logger.debug(f"Found pyproject.toml at {pyproject}")
-                return pyproject
-            if current.parent == current:  # Reached root
-                break
-            current = current.parent
-
-        logger.warning("Could not find pyproject.toml")
-        return None
+        # abspath normalizes the path without the per-component filesystem
+        # lookups resolve() makes to follow symlinks
+        return _find_pyproject_toml_from(os.path.abspath(start_path or "."))
 
     def _load_settings(self) -> dict[str, Any]:
         """Load settings from pyproject.toml."""
@@ -57,14 +98,15 @@ class PGSettings:
             logger.warning(
                 f"pyproject.toml not found at {self.config_path}, using defaults"
             )
-            return self.DEFAULT_SETTINGS.copy()
+            return copy.deepcopy(self.DEFAULT_SETTINGS)
 
         try:
-            with open(self.config_path, "rb") as f:
-                data = tomllib.load(f)
+            path = Path(self.config_path)
+            stat = path.stat()
+            data = _load_toml(str(path), stat.st_mtime_ns, stat.st_size)
         except Exception as e:
             logger.error(f"Error reading pyproject.toml: {e}")
-            return self.DEFAULT_SETTINGS.copy()
+            return copy.deepcopy(self.DEFAULT_SETTINGS)
 
         # Get [tool.render-engine.pg] section
         pg_settings = (
@@ -73,9 +115,10 @@ class PGSettings:
             .get("pg", {})
         )
 
-        # Merge with defaults
-        merged = self.DEFAULT_SETTINGS.copy()
-        merged.update(pg_settings)
+        # Merge with defaults; deep copies keep this instance's settings from
+        # aliasing the cached parse (or the class defaults) of other instances
+        merged = copy.deepcopy(self.DEFAULT_SETTINGS)
+        merged.update(copy.deepcopy(pg_settings))
 
         logger.debug(f"Loaded PG settings: {merged}")
         return merged
@@ -122,11 +165,11 @@ class PGSettings:
         queries = insert_sql.get(collection_name, "")
 
         if isinstance(queries, str):
-            # Split by semicolon and filter empty queries
-            return [q.strip() for q in queries.split(";") if q.strip()]
+            # Split on semicolons and drop empty/blank queries (e.g. from ";;")
+            return [q for q in map(str.strip, queries.split(";")) if q]
 
         if isinstance(queries, list):
-            return queries
+            return list(queries)
 
         return []
 
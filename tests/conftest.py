@@ -1,6 +1,9 @@
 """Pytest configuration and fixtures."""
 
 import pytest
+from psycopg.pq import TransactionStatus
+
+from render_engine_pg import content_manager, re_settings_parser
 
 
 @pytest.fixture
@@ -8,4 +11,235 @@ def mock_connection(mocker):
     """Create a mock database connection."""
     mock_conn = mocker.MagicMock()
     mock_conn.autocommit = True
+    mock_conn.info.transaction_status = TransactionStatus.IDLE
     return mock_conn
+
+
+@pytest.fixture(autouse=True)
+def clear_content_manager_caches():
+    """Reset process-wide caches so patched settings don't leak between tests."""
+    content_manager._get_settings.cache_clear()
+    content_manager._compile_insert.cache_clear()
+    yield
+    content_manager._get_settings.cache_clear()
+    content_manager._compile_insert.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_settings_caches():
+    """Reset the pyproject.toml search and parse caches between tests."""
+    re_settings_parser._search_pyproject_toml.cache_clear()
+    re_settings_parser._load_toml.cache_clear()
+    yield
+    re_settings_parser._search_pyproject_toml.cache_clear()
+    re_settings_parser._load_toml.cache_clear()
+
+
+# Schema samples shared by the CLI tests, written to disk once per session
+SQL_SAMPLES = {
+    "unmarked_blog": """
+        CREATE TABLE blog (
+            id integer NOT NULL,
+            title varchar(255) NOT NULL,
+            content text NOT NULL
+        );
+        """,
+    "unmarked_blog_tags": """
+        CREATE TABLE blog (
+            id integer NOT NULL,
+            title varchar(255) NOT NULL,
+            content text NOT NULL
+        );
+
+        CREATE TABLE tags (
+            id integer NOT NULL,
+            name varchar(100) NOT NULL
+        );
+
+        CREATE TABLE blog_tags (
+            blog_id integer NOT NULL,
+            tag_id integer NOT NULL
+        );
+        """,
+    "unmarked_alter_table_pk": """
+        CREATE TABLE blog (
+            id integer NOT NULL,
+            title varchar(255) NOT NULL,
+            content text NOT NULL
+        );
+
+        ALTER TABLE ONLY blog
+            ADD CONSTRAINT blog_pkey PRIMARY KEY (id);
+
+        CREATE TABLE tags (
+            id integer NOT NULL,
+            name varchar(100) NOT NULL
+        );
+
+        ALTER TABLE ONLY tags
+            ADD CONSTRAINT tags_pkey PRIMARY KEY (id);
+        """,
+    "collection_blog_unmarked_tags": """
+        -- @collection
+        CREATE TABLE blog (
+            id integer NOT NULL,
+            title varchar(255) NOT NULL
+        );
+
+        CREATE TABLE tags (
+            id integer NOT NULL,
+            name varchar(100) NOT NULL
+        );
+        """,
+    "collection_blog": """
+        -- @collection
+        CREATE TABLE blog (
+            id integer NOT NULL,
+            title varchar(255) NOT NULL,
+            content text NOT NULL
+        );
+        """,
+    "collection_blog_title": """
+        -- @collection
+        CREATE TABLE blog (
+            id integer NOT NULL,
+            title varchar(255) NOT NULL
+        );
+        """,
+    "collection_blog_id": """
+        -- @collection
+        CREATE TABLE blog (
+            id integer NOT NULL
+        );
+        """,
+    "collection_blog_slug_pk": """
+        -- @collection
+        CREATE TABLE blog (
+            id integer NOT NULL,
+            slug varchar(255) NOT NULL,
+            title varchar(255) NOT NULL,
+            content text NOT NULL
+        );
+
+        ALTER TABLE ONLY blog
+            ADD CONSTRAINT blog_pkey PRIMARY KEY (id);
+        """,
+    "collection_blog_timestamps_pk": """
+        -- @collection
+        CREATE TABLE blog (
+            id integer NOT NULL,
+            title varchar(255) NOT NULL,
+            content text NOT NULL,
+            created_at timestamp without time zone DEFAULT CURRENT_TIMESTAMP,
+            updated_at timestamp without time zone DEFAULT CURRENT_TIMESTAMP
+        );
+
+        ALTER TABLE ONLY blog
+            ADD CONSTRAINT blog_pkey PRIMARY KEY (id);
+        """,
+    "junction_composite_pk": """
+        -- @junction
+        CREATE TABLE blog_tags (
+            blog_id integer NOT NULL,
+            tag_id integer NOT NULL,
+            created_at timestamp without time zone
+        );
+
+        ALTER TABLE ONLY blog_tags
+            ADD CONSTRAINT blog_tags_pkey PRIMARY KEY (blog_id, tag_id);
+        """,
+    "annotated_blog_tags_pk": """
+        -- @collection
+        CREATE TABLE blog (
+            id integer NOT NULL,
+            title varchar(255) NOT NULL
+        );
+
+        ALTER TABLE ONLY blog
+            ADD CONSTRAINT blog_pkey PRIMARY KEY (id);
+
+        -- @attribute
+        CREATE TABLE tags (
+            id integer NOT NULL,
+            name varchar(100) NOT NULL
+        );
+
+        ALTER TABLE ONLY tags
+            ADD CONSTRAINT tags_pkey PRIMARY KEY (id);
+
+        -- @junction
+        CREATE TABLE blog_tags (
+            blog_id integer NOT NULL,
+            tag_id integer NOT NULL
+        );
+
+        ALTER TABLE ONLY blog_tags
+            ADD CONSTRAINT blog_tags_pkey PRIMARY KEY (blog_id, tag_id);
+        """,
+    "kjaymiller_schema": """
+        CREATE TABLE blog (
+            id integer NOT NULL,
+            slug character varying(255) NOT NULL,
+            title character varying(255) NOT NULL,
+            content text NOT NULL,
+            description text,
+            date timestamp without time zone NOT NULL
+        );
+
+        ALTER TABLE ONLY blog
+            ADD CONSTRAINT blog_pkey PRIMARY KEY (id);
+
+        CREATE TABLE tags (
+            id integer NOT NULL,
+            name character varying(100) NOT NULL,
+            created_at timestamp without time zone DEFAULT CURRENT_TIMESTAMP
+        );
+
+        ALTER TABLE ONLY tags
+            ADD CONSTRAINT tags_pkey PRIMARY KEY (id);
+
+        CREATE TABLE blog_tags (
+            blog_id integer NOT NULL,
+            tag_id integer NOT NULL,
+            created_at timestamp without time zone DEFAULT CURRENT_TIMESTAMP
+        );
+
+        ALTER TABLE ONLY blog_tags
+            ADD CONSTRAINT blog_tags_pkey PRIMARY KEY (blog_id, tag_id);
+        """,
+    "unmarked_posts_categories": """
+        CREATE TABLE posts (
+            id integer NOT NULL,
+            title varchar(255) NOT NULL,
+            content text NOT NULL
+        );
+
+        CREATE TABLE categories (
+            id integer NOT NULL,
+            name varchar(100) NOT NULL
+        );
+
+        CREATE TABLE post_categories (
+            post_id integer NOT NULL,
+            category_id integer NOT NULL
+        );
+        """,
+    "comment_only": "-- Just a comment",
+}
+
+
+@pytest.fixture(scope="session")
+def sql_corpus(tmp_path_factory):
+    """Write each SQL_SAMPLES schema once and map its name to the file path."""
+    directory = tmp_path_factory.mktemp("sql_corpus")
+    corpus = {}
+    for name, sql in SQL_SAMPLES.items():
+        path = directory / f"{name}.sql"
+        path.write_text(sql)
+        corpus[name] = path
+
+    # A non-.sql file for the extension warning
+    not_sql = directory / "schema.txt"
+    not_sql.write_text("CREATE TABLE test (id int);")
+    corpus["not_sql"] = not_sql
+    return corpus
@@ -1,7 +1,12 @@
 """Tests for render-engine-pg ingestion logic in PostgresContentManager."""
 
-import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock
+
+import psycopg
+import pytest
+from psycopg.pq import TransactionStatus
+from render_engine_pg import content_manager
 from render_engine_pg.content_manager import PostgresContentManager
 
 
@@ -15,10 +20,11 @@ class TestPostgresContentManagerTemplateConversion:
         # First template has all fields
         template1 = "INSERT INTO posts (id, title) VALUES ({id}, {title})"
         # Just check if it converts without error
-        param_query, values = PostgresContentManager._convert_template_to_parameterized(
+        param_query, params = PostgresContentManager._convert_template_to_parameterized(
             template1, frontmatter_data
         )
-        assert values == [1, "My Post"]
+        assert param_query == "INSERT INTO posts (id, title) VALUES (%(id)s, %(title)s)"
+        assert params is frontmatter_data
 
         # Second template has missing fields - should raise KeyError
         template2 = "INSERT INTO metadata (id, author) VALUES ({id}, {author})"
@@ -43,6 +49,27 @@ class TestPostgresContentManagerTemplateConversion:
             pass  # Expected
 
 
+class TestParseTemplate:
+    """Test the cached {placeholder} template parser."""
+
+    def test_parse_template_named_placeholders(self):
+        """Placeholders become named parameters, each field listed once."""
+        param_query, field_names = content_manager._parse_template(
+            "INSERT INTO t (a, b) VALUES ({id}, {id})"
+        )
+
+        assert param_query == "INSERT INTO t (a, b) VALUES (%(id)s, %(id)s)"
+        assert field_names == ("id",)
+
+    def test_parse_template_escapes_literal_percent(self):
+        """Literal % signs survive psycopg parameter binding."""
+        param_query, _ = content_manager._parse_template(
+            "INSERT INTO t (pct) SELECT x FROM y WHERE z LIKE '5%' AND id = {id}"
+        )
+
+        assert param_query.endswith("LIKE '5%%' AND id = %(id)s")
+
+
 class TestPostgresContentManagerListIteration:
     """Test PostgresContentManager list iteration for template substitution."""
 
@@ -57,7 +84,9 @@ class TestPostgresContentManagerListIteration:
         )
 
         assert result is True
-        assert mock_cursor.execute.call_count == 2
+        param_query, params_seq = mock_cursor.executemany.call_args[0]
+        assert param_query == "INSERT INTO tags (name) VALUES (%(name)s)"
+        assert [params["name"] for params in params_seq] == ["python", "databases"]
 
     def test_try_execute_with_list_iteration_no_lists(self, mocker):
         """Test that it returns False when no lists are present."""
@@ -71,6 +100,7 @@ class TestPostgresContentManagerListIteration:
 
         assert result is False
         assert mock_cursor.execute.call_count == 0
+        assert mock_cursor.executemany.call_count == 0
 
 
 class TestPostgresContentManagerCreateEntryStatic:
@@ -114,5 +144,327 @@ Post body."""
             table="posts",
         )
 
-        # 2 tags + 1 post template + 1 main insert = 4 calls.
+        # Savepoints, the post template and the main insert go through execute;
+        # the 2 tags are batched into a single executemany.
         assert mock_cursor.execute.call_count >= 3
+        mock_cursor.executemany.assert_called_once()
+
+    def test_create_entry_values_follow_filtered_columns(self, mocker):
+        """Only read_sql columns are inserted, with values in column order."""
+        mock_settings = MagicMock()
+        mock_settings.get_insert_sql.return_value = []
+        mock_settings.get_read_sql.return_value = "SELECT title, content FROM posts"
+        mocker.patch(
+            "render_engine_pg.content_manager.PGSettings", return_value=mock_settings
+        )
+        compile_insert = mocker.patch(
+            "render_engine_pg.content_manager._compile_insert"
+        )
+        mock_connection = MagicMock()
+        mock_cursor = mock_connection.cursor.return_value.__enter__.return_value
+
+        PostgresContentManager.create_entry_static(
+            content="---\ntitle: My Post\ndraft: true\n---\nBody",
+            collection_name="blog",
+            connection=mock_connection,
+            table="Posts",
+        )
+
+        compile_insert.assert_called_once_with("posts", ("title", "content"))
+        assert mock_cursor.execute.call_args.args[1] == ("My Post", "Body")
+
+    def test_create_entry_loads_settings_once(self, mocker):
+        """Settings are loaded once and reused across create_entry calls."""
+        mock_settings = MagicMock()
+        mock_settings.get_insert_sql.return_value = []
+        mock_settings.get_read_sql.return_value = None
+        settings_cls = mocker.patch(
+            "render_engine_pg.content_manager.PGSettings", return_value=mock_settings
+        )
+
+        for title in ("One", "Two", "Three"):
+            PostgresContentManager.create_entry_static(
+                content=f"---\ntitle: {title}\n---\nBody",
+                collection_name="blog",
+                table="posts",
+            )
+
+        settings_cls.assert_called_once_with()
+
+
+class TestCompileInsert:
+    """Test the cached INSERT statement builder."""
+
+    def test_compile_insert_reuses_statement_for_same_columns(self):
+        """The same table and column set yields the same composed statement."""
+        first = content_manager._compile_insert("posts", ("title", "content"))
+        second = content_manager._compile_insert("posts", ("title", "content"))
+        other = content_manager._compile_insert("posts", ("title",))
+
+        assert first is second
+        assert other is not first
+
+
+class TestAllowedColumns:
+    """Test the cached read_sql column extraction."""
+
+    def test_allowed_columns_strips_aliases_and_table_prefixes(self):
+        """Aliased and table-qualified columns reduce to their bare names."""
+        columns = content_manager._allowed_columns(
+            "SELECT posts.id, posts.title as title, content FROM posts"
+        )
+
+        assert columns == frozenset({"id", "title", "content"})
+
+    def test_allowed_columns_without_select_clause(self):
+        """read_sql that isn't a SELECT ... FROM allows every column."""
+        assert content_manager._allowed_columns("TABLE posts") is None
+
+
+class TestPostgresContentManagerBulkCreateEntries:
+    """Test PostgresContentManager.bulk_create_entries()."""
+
+    @pytest.fixture
+    def bulk_connection(self, mocker):
+        """Connection whose inserts compose to mocks instead of real SQL."""
+        mock_settings = MagicMock()
+        mock_settings.get_insert_sql.return_value = []
+        mock_settings.get_read_sql.return_value = None
+        mocker.patch(
+            "render_engine_pg.content_manager.PGSettings", return_value=mock_settings
+        )
+
+        from psycopg import sql
+
+        mocker.patch.object(sql.SQL, "format", lambda *args, **kwargs: MagicMock())
+
+        mock_connection = MagicMock()
+        mock_connection.autocommit = True
+        mock_connection.info.transaction_status = TransactionStatus.IDLE
+        return mock_connection
+
+    def test_bulk_create_entries_commits_once(self, bulk_connection):
+        """All entries are inserted in one transaction with a single commit."""
+        mock_cursor = bulk_connection.cursor.return_value.__enter__.return_value
+        contents = [f"---\ntitle: Post {i}\n---\nBody {i}" for i in range(3)]
+
+        results = PostgresContentManager.bulk_create_entries(
+            contents, connection=bulk_connection, table="posts"
+        )
+
+        assert len(results) == 3
+        mock_cursor.execute.assert_not_called()
+        mock_cursor.executemany.assert_called_once()
+        params_seq = mock_cursor.executemany.call_args[0][1]
+        assert params_seq == [(f"Post {i}", f"Body {i}") for i in range(3)]
+        bulk_connection.cursor.assert_called_once()
+        bulk_connection.commit.assert_called_once()
+        assert bulk_connection.autocommit is True
+
+    def test_bulk_create_entries_groups_runs_by_columns(self, bulk_connection):
+        """Consecutive entries with the same columns share one executemany."""
+        mock_cursor = bulk_connection.cursor.return_value.__enter__.return_value
+        contents = [
+            "---\ntitle: A\n---\nBody A",
+            "---\ntitle: B\n---\nBody B",
+            "---\ntitle: C\nslug: c\n---\nBody C",
+            "---\ntitle: D\n---\nBody D",
+        ]
+
+        PostgresContentManager.bulk_create_entries(
+            contents, connection=bulk_connection, table="posts"
+        )
+
+        batches = [c[0][1] for c in mock_cursor.executemany.call_args_list]
+        assert batches == [
+            [("A", "Body A"), ("B", "Body B")],
+            [("C", "c", "Body C")],
+            [("D", "Body D")],
+        ]
+
+    def test_bulk_create_entries_renders_shared_statement_once(self, mocker):
+        """Entries with the same columns render their INSERT text once."""
+        mock_settings = MagicMock()
+        mock_settings.get_insert_sql.return_value = []
+        mock_settings.get_read_sql.return_value = None
+        mocker.patch(
+            "render_engine_pg.content_manager.PGSettings", return_value=mock_settings
+        )
+        insert_query = MagicMock()
+        insert_query.as_string.return_value = "INSERT INTO posts ..."
+        mocker.patch(
+            "render_engine_pg.content_manager._compile_insert",
+            return_value=insert_query,
+        )
+        contents = [f"---\ntitle: Post {i}\n---\nBody {i}" for i in range(3)]
+
+        results = PostgresContentManager.bulk_create_entries(
+            contents, connection=MagicMock(), table="posts"
+        )
+
+        assert results == ["INSERT INTO posts ..."] * 3
+        insert_query.as_string.assert_called_once()
+
+    def test_bulk_create_entries_rolls_back_on_error(self, bulk_connection):
+        """A failing entry rolls back the whole batch."""
+        mock_cursor = bulk_connection.cursor.return_value.__enter__.return_value
+        mock_cursor.executemany.side_effect = RuntimeError("duplicate key")
+        contents = [f"---\ntitle: Post {i}\n---\nBody {i}" for i in range(3)]
+
+        with pytest.raises(RuntimeError, match="duplicate key"):
+            PostgresContentManager.bulk_create_entries(
+                contents, connection=bulk_connection, table="posts"
+            )
+
+        bulk_connection.commit.assert_not_called()
+        bulk_connection.rollback.assert_called_once()
+        assert bulk_connection.autocommit is True
+
+    def test_bulk_create_entries_nests_in_open_transaction(self, bulk_connection):
+        """Inside a caller's transaction, entries go in a savepoint and aren't committed."""
+        bulk_connection.info.transaction_status = TransactionStatus.INTRANS
+        mock_cursor = bulk_connection.cursor.return_value.__enter__.return_value
+        contents = [f"---\ntitle: Post {i}\n---\nBody {i}" for i in range(3)]
+
+        PostgresContentManager.bulk_create_entries(
+            contents, connection=bulk_connection, table="posts"
+        )
+
+        mock_cursor.executemany.assert_called_once()
+        bulk_connection.transaction.assert_called_once_with()
+        bulk_connection.commit.assert_not_called()
+        assert bulk_connection.autocommit is True
+
+
+class _StubCursor:
+    """Cursor recording executemany calls, optionally failing on a value."""
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.batches = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def execute(self, query, params=None, **kwargs):
+        raise AssertionError("bulk inserts should go through executemany")
+
+    def executemany(self, query, params_seq):
+        params_seq = list(params_seq)
+        if any(self.fail_on in params for params in params_seq):
+            raise RuntimeError("duplicate key")
+        self.batches.append((query, params_seq))
+
+
+class _StubConnection:
+    """Connection that can render composed SQL without a server."""
+
+    # as_string() only needs the adapters (and no live connection)
+    adapters = psycopg.adapters
+    connection = None
+
+    def __init__(self, fail_on=None):
+        self.autocommit = True
+        self.info = SimpleNamespace(transaction_status=TransactionStatus.IDLE)
+        self.commits = 0
+        self.rollbacks = 0
+        self.stub_cursor = _StubCursor(fail_on)
+
+    def cursor(self):
+        return self.stub_cursor
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class TestBulkInsertComposedQueries:
+    """Bulk inserts checked against the real composed SQL and parameter rows."""
+
+    @pytest.fixture(autouse=True)
+    def no_templates(self, mocker):
+        """Settings without insert_sql templates or read_sql column filters."""
+        mock_settings = MagicMock()
+        mock_settings.get_insert_sql.return_value = []
+        mock_settings.get_read_sql.return_value = None
+        mocker.patch(
+            "render_engine_pg.content_manager.PGSettings", return_value=mock_settings
+        )
+
+    def test_bulk_create_entries_composed_queries(self):
+        """Each run of matching columns is one executemany of the rendered INSERT."""
+        connection = _StubConnection()
+        contents = [
+            "---\ntitle: A\n---\nBody A",
+            "---\ntitle: B\n---\nBody B",
+            "---\ntitle: C\nslug: c\n---\nBody C",
+        ]
+
+        results = PostgresContentManager.bulk_create_entries(
+            contents, connection=connection, table="Posts"
+        )
+
+        two_columns = 'INSERT INTO "posts" ("title", "content") VALUES (%s, %s)'
+        three_columns = (
+            'INSERT INTO "posts" ("title", "slug", "content") VALUES (%s, %s, %s)'
+        )
+        assert [
+            (query.as_string(connection), rows)
+            for query, rows in connection.stub_cursor.batches
+        ] == [
+            (two_columns, [("A", "Body A"), ("B", "Body B")]),
+            (three_columns, [("C", "c", "Body C")]),
+        ]
+        assert results == [two_columns, two_columns, three_columns]
+        # Entries sharing a statement share its rendered text
+        assert results[0] is results[1]
+        assert connection.commits == 1
+
+    def test_populate_from_directory_inserts_files_in_order(self, tmp_path):
+        """Files are read in name order with slugs and shared metadata filled in."""
+        (tmp_path / "2024-01-02-second.md").write_text("---\ntitle: Second\n---\nTwo")
+        (tmp_path / "2024-01-01-first.md").write_text("---\ntitle: First\n---\nOne")
+        (tmp_path / "notes.txt").write_text("not markdown")
+        connection = _StubConnection()
+
+        results = PostgresContentManager.populate_from_directory(
+            tmp_path,
+            connection=connection,
+            collection_name="blog",
+            table="posts",
+            author="me",
+        )
+
+        query, rows = connection.stub_cursor.batches[0]
+        assert len(connection.stub_cursor.batches) == 1
+        assert results == [query.as_string(connection)] * 2
+        assert query.as_string(connection) == (
+            'INSERT INTO "posts" ("author", "slug", "title", "content") '
+            "VALUES (%s, %s, %s, %s)"
+        )
+        assert rows == [
+            ("me", "first", "First", "One"),
+            ("me", "second", "Second", "Two"),
+        ]
+        assert connection.commits == 1
+
+    def test_populate_from_directory_one_bad_file_rolls_back_all(self, tmp_path):
+        """A failing file rolls back the whole directory, not just itself."""
+        for name in ("a", "b", "c"):
+            (tmp_path / f"{name}.md").write_text(f"---\ntitle: {name}\n---\nBody")
+        connection = _StubConnection(fail_on="b")
+
+        with pytest.raises(RuntimeError, match="duplicate key"):
+            PostgresContentManager.populate_from_directory(
+                tmp_path, connection=connection, collection_name="blog", table="posts"
+            )
+
+        assert connection.stub_cursor.batches == []
+        assert connection.commits == 0
+        assert connection.rollbacks == 1
+        assert connection.autocommit is True
@@ -1,26 +1,75 @@
-from render_engine_pg.parsers import PGPageParser
+from contextlib import contextmanager
+
+from render_engine_pg.parsers import PGPageParser, STREAM_ITERSIZE
 from render_engine_pg.connection import PostgresQuery
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
+
+
+class _StubCursor:
+    """Cursor returning canned rows and recording what was executed."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+        self.fetchall_called = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def execute(self, query, **kwargs):
+        self.executed.append((query, kwargs))
+
+    def fetchall(self):
+        self.fetchall_called = True
+        return list(self.rows)
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+
+class _StubConnection:
+    """Connection handing out a single _StubCursor."""
+
+    def __init__(self, rows):
+        self.stub_cursor = _StubCursor(rows)
+        self.cursor_kwargs = None
+        self.transactions = 0
+
+    def cursor(self, **kwargs):
+        self.cursor_kwargs = kwargs
+        return self.stub_cursor
+
+    @contextmanager
+    def transaction(self):
+        self.transactions += 1
+        yield
 
 
 def test_parse_content_path_with_query():
-    # Mock connection and cursor
-    mock_cursor = MagicMock()
-    mock_cursor.fetchall.return_value = [
-        {"title": "Post 1", "content": "Content 1"},
-        {"title": "Post 2", "content": "Content 2"},
-    ]
-    mock_connection = MagicMock()
-    mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
+    # Stub connection and cursor
+    connection = _StubConnection(
+        [
+            {"title": "Post 1", "content": "Content 1"},
+            {"title": "Post 2", "content": "Content 2"},
+        ]
+    )
 
     # Create PostgresQuery
-    query = PostgresQuery(connection=mock_connection, query="SELECT * FROM posts")
+    query = PostgresQuery(connection=connection, query="SELECT * FROM posts")
 
     # Parse
     attrs, content = PGPageParser.parse_content_path(query)
 
     # Verify
-    mock_cursor.execute.assert_called_with("SELECT * FROM posts")
+    assert connection.stub_cursor.executed == [
+        ("SELECT * FROM posts", {"prepare": True})
+    ]
     assert attrs == {
         "data": [
             {"title": "Post 1", "content": "Content 1"},
@@ -32,16 +81,13 @@ def test_parse_content_path_with_query():
 
 
 def test_parse_content_path_with_collection_name():
-    # Mock connection and cursor
-    mock_cursor = MagicMock()
-    mock_cursor.fetchall.return_value = [
-        {"title": "From Settings", "content": "Settings Content"}
-    ]
-    mock_connection = MagicMock()
-    mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
+    # Stub connection and cursor
+    connection = _StubConnection(
+        [{"title": "From Settings", "content": "Settings Content"}]
+    )
 
     # Create PostgresQuery with collection_name
-    query = PostgresQuery(connection=mock_connection, collection_name="blog")
+    query = PostgresQuery(connection=connection, collection_name="blog")
 
     # Mock settings
     with patch("render_engine_pg.parsers.PGSettings") as MockSettings:
@@ -54,7 +100,9 @@ def test_parse_content_path_with_collection_name():
         # Verify
         MockSettings.assert_called()
         mock_settings_instance.get_read_sql.assert_called_with("blog")
-        mock_cursor.execute.assert_called_with("SELECT * FROM blog_posts")
+        assert connection.stub_cursor.executed == [
+            ("SELECT * FROM blog_posts", {"prepare": True})
+        ]
         assert attrs == {
             "data": [{"title": "From Settings", "content": "Settings Content"}]
         }
@@ -62,6 +110,62 @@ def test_parse_content_path_with_collection_name():
         print("test_parse_content_path_with_collection_name passed")
 
 
+def test_parse_content_path_streams_with_server_side_cursor():
+    rows = [{"title": f"Post {i}"} for i in range(3)]
+    connection = _StubConnection(rows)
+
+    query = PostgresQuery(
+        connection=connection, query="SELECT * FROM posts", stream=True
+    )
+
+    attrs, content = PGPageParser.parse_content_path(query)
+
+    assert connection.transactions == 1
+    assert connection.cursor_kwargs["name"] == "pg_parser_stream"
+    assert connection.stub_cursor.itersize == STREAM_ITERSIZE
+    assert connection.stub_cursor.executed == [("SELECT * FROM posts", {})]
+    assert not connection.stub_cursor.fetchall_called
+    assert attrs == {"data": rows}
+    assert content is None
+
+
+def test_parse_content_path_expected_one_row_uses_fetchone():
+    connection = _StubConnection([{"title": "Post 1", "content": "Content 1"}])
+
+    query = PostgresQuery(
+        connection=connection,
+        query="SELECT * FROM posts WHERE id = 1",
+        expected_rows="one",
+    )
+
+    attrs, content = PGPageParser.parse_content_path(query)
+
+    assert connection.stub_cursor.executed == [
+        ("SELECT * FROM posts WHERE id = 1", {"prepare": True})
+    ]
+    assert not connection.stub_cursor.fetchall_called
+    assert attrs == {"title": "Post 1", "content": "Content 1"}
+    assert content is None
+
+
+def test_parse_content_path_expected_one_row_missing():
+    connection = _StubConnection([])
+
+    query = PostgresQuery(
+        connection=connection,
+        query="SELECT * FROM posts WHERE id = 1",
+        expected_rows="one",
+    )
+
+    attrs, content = PGPageParser.parse_content_path(query)
+
+    assert attrs == {}
+    assert content is None
+
+
 if __name__ == "__main__":
     test_parse_content_path_with_query()
     test_parse_content_path_with_collection_name()
+    test_parse_content_path_streams_with_server_side_cursor()
+    test_parse_content_path_expected_one_row_uses_fetchone()
+    test_parse_content_path_expected_one_row_missing()
@@ -22,6 +22,33 @@ class TestPGSettings:
         settings = PGSettings(config_path=pyproject)
         assert settings.config_path == pyproject
 
+    def test_find_pyproject_toml_searches_parent_directories(self, tmp_path):
+        """Test the upward search from a nested start directory."""
+        nested_dir = tmp_path / "src" / "render_engine_pg"
+        nested_dir.mkdir(parents=True)
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text("[tool.render-engine.pg]\n")
+
+        found = PGSettings._find_pyproject_toml(nested_dir)
+
+        assert found == pyproject
+        # Equivalent spellings of the start directory share one cached search
+        assert PGSettings._find_pyproject_toml(nested_dir / ".." / "render_engine_pg") is found
+
+    def test_find_pyproject_toml_created_after_a_miss(self, tmp_path, caplog):
+        """A missing pyproject.toml isn't cached: creating it later is found."""
+        start = tmp_path / "a" / "b" / "c" / "d" / "e" / "f" / "g" / "h" / "i" / "j"
+        start.mkdir(parents=True)
+
+        assert PGSettings._find_pyproject_toml(start) is None
+        assert PGSettings._find_pyproject_toml(start) is None
+        assert caplog.text.count("Could not find pyproject.toml") == 2
+
+        pyproject = start / "pyproject.toml"
+        pyproject.write_text("[tool.render-engine.pg]\n")
+
+        assert PGSettings._find_pyproject_toml(start) == pyproject
+
     def test_load_settings_with_insert_sql(self, tmp_path):
         """Test loading settings with insert_sql configuration."""
         pyproject = tmp_path / "pyproject.toml"
@@ -103,3 +130,70 @@ insert_sql = { posts = "INSERT INTO users (name) VALUES ('Alice');;INSERT INTO u
 
         assert len(queries) == 2
         assert all(q for q in queries)  # No empty strings
+
+    def test_load_is_cached_per_file(self, tmp_path, mocker):
+        """Repeated PGSettings on an unchanged file parse the TOML once."""
+        from render_engine_pg import re_settings_parser
+
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[tool.render-engine.pg]\nread_sql = { posts = "SELECT 1" }\n')
+        load = mocker.spy(re_settings_parser.tomllib, "load")
+
+        first = PGSettings(config_path=pyproject)
+        second = PGSettings(config_path=pyproject)
+
+        assert load.call_count == 1
+        assert first.get_read_sql("posts") == second.get_read_sql("posts") == "SELECT 1"
+
+    def test_load_reparses_modified_file(self, tmp_path):
+        """Editing pyproject.toml invalidates the cached parse."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[tool.render-engine.pg]\nread_sql = { posts = "SELECT 1" }\n')
+        assert PGSettings(config_path=pyproject).get_read_sql("posts") == "SELECT 1"
+
+        pyproject.write_text('[tool.render-engine.pg]\nread_sql = { posts = "SELECT 22" }\n')
+        assert PGSettings(config_path=pyproject).get_read_sql("posts") == "SELECT 22"
+
+    def test_load_settings_with_offset_datetime(self, tmp_path):
+        """A valid pyproject.toml with an offset datetime still loads its settings."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text(
+            """[tool.example]
+released = 2024-05-27T07:32:00-07:00
+
+[tool.render-engine.pg]
+read_sql = { posts = "SELECT 1" }
+"""
+        )
+
+        assert PGSettings(config_path=pyproject).get_read_sql("posts") == "SELECT 1"
+
+    def test_mutating_settings_does_not_leak_into_new_instances(self, tmp_path):
+        """Each instance gets its own copy of the cached settings."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text(
+            """[tool.render-engine.pg]
+read_sql = { posts = "SELECT 1" }
+insert_sql = { posts = ["INSERT INTO posts (title) VALUES ({title})"] }
+"""
+        )
+        first = PGSettings(config_path=pyproject)
+        first.settings["read_sql"]["posts"] = "SELECT 2"
+        first.settings["insert_sql"]["extra"] = "INSERT INTO extra DEFAULT VALUES"
+        first.get_insert_sql("posts").append("DELETE FROM posts")
+
+        second = PGSettings(config_path=pyproject)
+
+        assert second.get_read_sql("posts") == "SELECT 1"
+        assert "extra" not in second.settings["insert_sql"]
+        assert second.get_insert_sql("posts") == [
+            "INSERT INTO posts (title) VALUES ({title})"
+        ]
+
+    def test_mutating_default_settings_does_not_leak(self):
+        """Instances falling back to defaults don't share the default tables."""
+        missing = Path("/nonexistent/path/pyproject.toml")
+        PGSettings(config_path=missing).settings["read_sql"]["posts"] = "SELECT 1"
+
+        assert PGSettings(config_path=missing).settings["read_sql"] == {}
+        assert PGSettings.DEFAULT_SETTINGS["read_sql"] == {}
@@ -1,285 +1,126 @@
 """Tests for the SQL CLI."""
 
-from pathlib import Path
+import io
+import tomllib
+
 from click.testing import CliRunner
 import pytest
 
-from render_engine_pg.cli.sql_cli import main
+from render_engine_pg.cli.sql_cli import main, run
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def runner():
-    """Create a Click CLI runner."""
+    """Create a Click CLI runner, shared by the tests in a class."""
     return CliRunner()
 
 
+def run_output(input_file, **kwargs):
+    """Call run() and return what it wrote to stdout."""
+    stdout = io.StringIO()
+    run(input_file, stdout=stdout, **kwargs)
+    return stdout.getvalue()
+
+
+@pytest.fixture(scope="class")
+def blog_config(sql_corpus, tmp_path_factory):
+    """Run the CLI once to a file and parse the [tool.render-engine.pg] table."""
+    config = tmp_path_factory.mktemp("output") / "output.toml"
+    run(sql_corpus["collection_blog"], output=str(config))
+    with open(config, "rb") as f:
+        return tomllib.load(f)["tool"]["render-engine"]["pg"]
+
+
 class TestUnifiedCLIAutoClassification:
     """Tests for automatic classification mode (default)."""
 
-    def test_auto_classify_simple_schema(self, runner):
+    def test_auto_classify_simple_schema(self, sql_corpus):
         """Test auto-classification on a simple schema."""
-        with runner.isolated_filesystem():
-            # Create a simple SQL file with no annotations
-            with open("schema.sql", "w") as f:
-                f.write("""
-                CREATE TABLE blog (
-                    id integer NOT NULL,
-                    title varchar(255) NOT NULL,
-                    content text NOT NULL
-                );
-
-                CREATE TABLE tags (
-                    id integer NOT NULL,
-                    name varchar(100) NOT NULL
-                );
-
-                CREATE TABLE blog_tags (
-                    blog_id integer NOT NULL,
-                    tag_id integer NOT NULL
-                );
-                """)
-
-            # Run CLI
-            result = runner.invoke(main, ["schema.sql"])
-
-            assert result.exit_code == 0
-            assert "blog" in result.output
-            assert "tags" in result.output
-            assert "blog_tags" in result.output
-
-    def test_auto_classify_with_alter_table_pk(self, runner):
-        """Test auto-classification with ALTER TABLE PRIMARY KEY definitions."""
-        with runner.isolated_filesystem():
-            with open("schema.sql", "w") as f:
-                f.write("""
-                CREATE TABLE blog (
-                    id integer NOT NULL,
-                    title varchar(255) NOT NULL,
-                    content text NOT NULL
-                );
-
-                ALTER TABLE ONLY blog
-                    ADD CONSTRAINT blog_pkey PRIMARY KEY (id);
+        output = run_output(sql_corpus["unmarked_blog_tags"])
 
-                CREATE TABLE tags (
-                    id integer NOT NULL,
-                    name varchar(100) NOT NULL
-                );
+        assert "blog" in output
+        assert "tags" in output
+        assert "blog_tags" in output
 
-                ALTER TABLE ONLY tags
-                    ADD CONSTRAINT tags_pkey PRIMARY KEY (id);
-                """)
-
-            result = runner.invoke(main, ["schema.sql"])
+    def test_auto_classify_with_alter_table_pk(self, sql_corpus):
+        """Test auto-classification with ALTER TABLE PRIMARY KEY definitions."""
+        output = run_output(sql_corpus["unmarked_alter_table_pk"])
 
-            assert result.exit_code == 0
-            assert "[tool.render-engine.pg" in result.output
+        assert "[tool.render-engine.pg" in output
 
-    def test_auto_classify_preserves_annotations(self, runner):
+    def test_auto_classify_preserves_annotations(self, sql_corpus):
         """Test that annotated tables are preserved as-is in auto-classification."""
-        with runner.isolated_filesystem():
-            with open("schema.sql", "w") as f:
-                f.write("""
-                -- @collection
-                CREATE TABLE blog (
-                    id integer NOT NULL,
-                    title varchar(255) NOT NULL
-                );
-
-                CREATE TABLE tags (
-                    id integer NOT NULL,
-                    name varchar(100) NOT NULL
-                );
-                """)
-
-            result = runner.invoke(main, ["schema.sql"])
-
-            assert result.exit_code == 0
-            # blog should be in output as annotated collection
-            assert "blog" in result.output
-
-    def test_auto_classify_output_to_file(self, runner):
-        """Test writing auto-classification output to file."""
-        with runner.isolated_filesystem():
-            with open("schema.sql", "w") as f:
-                f.write("""
-                CREATE TABLE blog (
-                    id integer NOT NULL,
-                    title varchar(255) NOT NULL,
-                    content text NOT NULL
-                );
-                """)
-
-            result = runner.invoke(main, ["schema.sql", "-o", "config.toml"])
-
-            assert result.exit_code == 0
-            assert Path("config.toml").exists()
-            content = Path("config.toml").read_text()
-            assert "[tool.render-engine.pg" in content
-
-    def test_auto_classify_verbose(self, runner):
-        """Test verbose output in auto-classification."""
-        with runner.isolated_filesystem():
-            with open("schema.sql", "w") as f:
-                f.write("""
-                CREATE TABLE blog (
-                    id integer NOT NULL,
-                    title varchar(255) NOT NULL,
-                    content text NOT NULL
-                );
-                """)
+        # blog should be in output as annotated collection
+        assert "blog" in run_output(sql_corpus["collection_blog_unmarked_tags"])
 
-            result = runner.invoke(main, ["schema.sql", "-v"])
+    def test_auto_classify_verbose(self, sql_corpus, capsys):
+        """Test verbose output in auto-classification."""
+        run(sql_corpus["unmarked_blog"], verbose=True)
 
-            assert result.exit_code == 0
-            # Check for verbose output messages
-            assert ("Parsing SQL file" in result.output
-                    or "Found" in result.output
-                    or "collection" in result.output.lower())
+        # Check for verbose output messages
+        captured = capsys.readouterr()
+        assert "Parsing SQL file" in captured.err
+        assert "Found" in captured.err
 
 
 class TestUnifiedCLIIgnorePKFlag:
     """Tests for --ignore-pk flag with auto-classification."""
 
-    def test_ignore_pk_auto_classification(self, runner):
+    def test_ignore_pk_auto_classification(self, sql_corpus):
         """Test --ignore-pk flag with auto-classification."""
-        with runner.isolated_filesystem():
-            with open("schema.sql", "w") as f:
-                f.write("""
-                -- @collection
-                CREATE TABLE blog (
-                    id integer NOT NULL,
-                    slug varchar(255) NOT NULL,
-                    title varchar(255) NOT NULL,
-                    content text NOT NULL
-                );
-
-                ALTER TABLE ONLY blog
-                    ADD CONSTRAINT blog_pkey PRIMARY KEY (id);
-                """)
-
-            # Without --ignore-pk
-            result_without = runner.invoke(main, ["schema.sql"])
-            assert result_without.exit_code == 0
-            assert "(id, slug, title, content)" in result_without.output
-
-            # With --ignore-pk
-            result_with = runner.invoke(main, ["schema.sql", "--ignore-pk"])
-            assert result_with.exit_code == 0
-            assert "(slug, title, content)" in result_with.output
-            assert "INSERT INTO blog" in result_with.output
-
-    def test_ignore_pk_composite_key(self, runner):
+        schema = sql_corpus["collection_blog_slug_pk"]
+
+        # Without --ignore-pk
+        assert "(id, slug, title, content)" in run_output(schema)
+
+        # With --ignore-pk
+        output = run_output(schema, ignore_pk=True)
+        assert "(slug, title, content)" in output
+        assert "INSERT INTO blog" in output
+
+    def test_ignore_pk_composite_key(self, sql_corpus):
         """Test --ignore-pk with composite PRIMARY KEY on junction table."""
-        with runner.isolated_filesystem():
-            with open("schema.sql", "w") as f:
-                f.write("""
-                -- @junction
-                CREATE TABLE blog_tags (
-                    blog_id integer NOT NULL,
-                    tag_id integer NOT NULL,
-                    created_at timestamp without time zone
-                );
-
-                ALTER TABLE ONLY blog_tags
-                    ADD CONSTRAINT blog_tags_pkey PRIMARY KEY (blog_id, tag_id);
-                """)
-
-            result = runner.invoke(main, ["schema.sql", "--ignore-pk"])
-
-            assert result.exit_code == 0
-            # Junction PK columns should NOT be excluded - they are foreign keys needed for relationships
-            assert "blog_id, tag_id, created_at" in result.output or "blog_id,tag_id,created_at" in result.output.replace(" ", "")
-            # created_at should be excluded (it's not a PK or FK, and --ignore-pk should affect non-junction tables)
-            assert "INSERT INTO blog_tags" in result.output
-
-    def test_ignore_pk_multiple_tables(self, runner):
+        output = run_output(sql_corpus["junction_composite_pk"], ignore_pk=True)
+        # Junction PK columns should NOT be excluded - they are foreign keys needed for relationships
+        assert "blog_id, tag_id, created_at" in output or "blog_id,tag_id,created_at" in output.replace(" ", "")
+        # created_at should be excluded (it's not a PK or FK, and --ignore-pk should affect non-junction tables)
+        assert "INSERT INTO blog_tags" in output
+
+    def test_ignore_pk_multiple_tables(self, sql_corpus):
         """Test --ignore-pk across multiple tables with relationships."""
-        with runner.isolated_filesystem():
-            with open("schema.sql", "w") as f:
-                f.write("""
-                -- @collection
-                CREATE TABLE blog (
-                    id integer NOT NULL,
-                    title varchar(255) NOT NULL
-                );
-
-                ALTER TABLE ONLY blog
-                    ADD CONSTRAINT blog_pkey PRIMARY KEY (id);
-
-                -- @attribute
-                CREATE TABLE tags (
-                    id integer NOT NULL,
-                    name varchar(100) NOT NULL
-                );
-
-                ALTER TABLE ONLY tags
-                    ADD CONSTRAINT tags_pkey PRIMARY KEY (id);
-
-                -- @junction
-                CREATE TABLE blog_tags (
-                    blog_id integer NOT NULL,
-                    tag_id integer NOT NULL
-                );
-
-                ALTER TABLE ONLY blog_tags
-                    ADD CONSTRAINT blog_tags_pkey PRIMARY KEY (blog_id, tag_id);
-                """)
-
-            result = runner.invoke(main, ["schema.sql", "--ignore-pk"])
-
-            assert result.exit_code == 0
-            # Both blog and tags should be included (tags via junction to blog)
-            assert "INSERT INTO blog (title)" in result.output
-            # Tags should be included because blog_tags references it
-            assert "blog_tags" in result.output.lower() or "tags" in result.output.lower()
+        output = run_output(sql_corpus["annotated_blog_tags_pk"], ignore_pk=True)
+        # Both blog and tags should be included (tags via junction to blog)
+        assert "INSERT INTO blog (title)" in output
+        # Tags should be included because blog_tags references it
+        assert "blog_tags" in output.lower() or "tags" in output.lower()
 
 
 class TestUnifiedCLIInteractiveMode:
     """Tests for interactive mode with --interactive flag."""
 
-    def test_interactive_mode_with_input(self, runner):
+    def test_interactive_mode_with_input(self, runner, sql_corpus):
         """Test interactive mode prompts for unmarked tables."""
-        with runner.isolated_filesystem():
-            with open("schema.sql", "w") as f:
-                f.write("""
-                CREATE TABLE blog (
-                    id integer NOT NULL,
-                    title varchar(255) NOT NULL,
-                    content text NOT NULL
-                );
-                """)
-
-            # Provide 'c' for collection, then skip parent
-            result = runner.invoke(main, ["schema.sql", "--interactive"], input="c\n\n")
-
-            assert result.exit_code == 0
-            # Should show classification prompts
-            assert "Classify as" in result.output or "collection" in result.output.lower()
-
-    def test_interactive_mode_skip_annotated(self, runner):
-        """Test interactive mode only prompts for unmarked tables."""
-        with runner.isolated_filesystem():
-            with open("schema.sql", "w") as f:
-                f.write("""
-                -- @collection
-                CREATE TABLE blog (
-                    id integer NOT NULL,
-                    title varchar(255) NOT NULL
-                );
+        # Provide 'c' for collection, then skip parent
+        result = runner.invoke(
+            main, [str(sql_corpus["unmarked_blog"]), "--interactive"], input="c\n\n"
+        )
 
-                CREATE TABLE tags (
-                    id integer NOT NULL,
-                    name varchar(100) NOT NULL
-                );
-                """)
+        assert result.exit_code == 0
+        # Should show classification prompts
+        assert "Classify as" in result.output or "collection" in result.output.lower()
 
-            # Only tags is unmarked, so only one classification prompt expected
-            result = runner.invoke(main, ["schema.sql", "--interactive"], input="a\n\n")
+    def test_interactive_mode_skip_annotated(self, runner, sql_corpus):
+        """Test interactive mode only prompts for unmarked tables."""
+        # Only tags is unmarked, so only one classification prompt expected
+        result = runner.invoke(
+            main,
+            [str(sql_corpus["collection_blog_unmarked_tags"]), "--interactive"],
+            input="a\n\n",
+        )
 
-            assert result.exit_code == 0
-            # blog should already be classified
-            assert "blog" in result.output
+        assert result.exit_code == 0
+        # blog should already be classified
+        assert "blog" in result.output
 
 
 class TestUnifiedCLIErrorHandling:
@@ -292,220 +133,126 @@ class TestUnifiedCLIErrorHandling:
         assert result.exit_code != 0
         assert "Error" in result.output or "No such file" in result.output
 
-    def test_invalid_sql_file_warning(self, runner):
+    def test_invalid_sql_file_warning(self, sql_corpus):
         """Test warning for non-.sql files."""
-        with runner.isolated_filesystem():
-            with open("schema.txt", "w") as f:
-                f.write("CREATE TABLE test (id int);")
-
-            result = runner.invoke(main, ["schema.txt"])
+        # Should warn about file extension
+        assert "Warning" in run_output(sql_corpus["not_sql"])
 
-            # Should warn about file extension
-            assert "Warning" in result.output or result.exit_code == 0
-
-    def test_empty_file_error(self, runner):
+    def test_empty_file_error(self, sql_corpus):
         """Test error when SQL file has no valid tables."""
-        with runner.isolated_filesystem():
-            with open("schema.sql", "w") as f:
-                f.write("-- Just a comment")
+        with pytest.raises(ValueError, match="No classified objects"):
+            run(sql_corpus["comment_only"])
 
-            result = runner.invoke(main, ["schema.sql"])
+    def test_empty_file_exit_code(self, runner, sql_corpus):
+        """Test the CLI reports run() errors and exits non-zero."""
+        result = runner.invoke(main, [str(sql_corpus["comment_only"])])
 
-            assert result.exit_code != 0 or "Error" in result.output or result.exit_code == 0
+        assert result.exit_code == 1
+        assert "Error: No classified objects" in result.output
 
 
 class TestUnifiedCLIOutputFormats:
     """Tests for output formatting."""
 
-    def test_stdout_output(self, runner):
+    def test_stdout_output(self, sql_corpus):
         """Test TOML output to stdout."""
-        with runner.isolated_filesystem():
-            with open("schema.sql", "w") as f:
-                f.write("""
-                -- @collection
-                CREATE TABLE blog (
-                    id integer NOT NULL,
-                    title varchar(255) NOT NULL,
-                    content text NOT NULL
-                );
-                """)
-
-            result = runner.invoke(main, ["schema.sql"])
-
-            assert result.exit_code == 0
-            assert "[tool.render-engine.pg" in result.output
-            assert "blog" in result.output
-
-    def test_file_output(self, runner):
+        output = run_output(sql_corpus["collection_blog"])
+        assert "[tool.render-engine.pg" in output
+        assert "blog" in output
+
+    def test_file_output(self, blog_config):
         """Test TOML output to file."""
-        with runner.isolated_filesystem():
-            with open("schema.sql", "w") as f:
-                f.write("""
-                -- @collection
-                CREATE TABLE blog (
-                    id integer NOT NULL,
-                    title varchar(255) NOT NULL,
-                    content text NOT NULL
-                );
-                """)
-
-            result = runner.invoke(main, ["schema.sql", "-o", "output.toml"])
-
-            assert result.exit_code == 0
-            assert Path("output.toml").exists()
-            content = Path("output.toml").read_text()
-            assert "[tool.render-engine.pg" in content
-            assert "blog" in content
-
-    def test_nested_output_directory(self, runner):
-        """Test creating nested output directories."""
-        with runner.isolated_filesystem():
-            with open("schema.sql", "w") as f:
-                f.write("""
-                -- @collection
-                CREATE TABLE blog (
-                    id integer NOT NULL
-                );
-                """)
-
-            result = runner.invoke(main, ["schema.sql", "-o", "config/nested/output.toml"])
-
-            assert result.exit_code == 0
-            assert Path("config/nested/output.toml").exists()
+        assert set(blog_config) == {"insert_sql", "read_sql"}
+
+    def test_file_output_insert_sql(self, blog_config):
+        """Test the collection gets its INSERT template."""
+        assert blog_config["insert_sql"]["blog"] == [
+            "INSERT INTO blog (id, title, content) VALUES ({id}, {title}, {content}) RETURNING id;"
+        ]
+
+    def test_file_output_read_sql(self, blog_config):
+        """Test the collection gets its SELECT query."""
+        assert blog_config["read_sql"]["blog"].startswith(
+            "SELECT blog.id, blog.title, blog.content FROM blog"
+        )
+
+    @pytest.mark.parametrize(
+        ("schema_name", "output_name"),
+        [
+            ("unmarked_blog", "config.toml"),
+            ("collection_blog_id", "config/nested/output.toml"),
+        ],
+    )
+    def test_output_file(self, sql_corpus, tmp_path, schema_name, output_name):
+        """Test writing output to a file, creating missing parent directories."""
+        config = tmp_path / output_name
+
+        run(sql_corpus[schema_name], output=str(config))
+
+        assert config.exists()
+        assert "[tool.render-engine.pg" in config.read_text()
 
 
 class TestUnifiedCLIComplexSchemas:
     """Tests for complex real-world schemas."""
 
-    def test_kjaymiller_schema_structure(self, runner):
+    def test_kjaymiller_schema_structure(self, sql_corpus):
         """Test processing a schema similar to kjaymiller.com."""
-        with runner.isolated_filesystem():
-            with open("schema.sql", "w") as f:
-                f.write("""
-                CREATE TABLE blog (
-                    id integer NOT NULL,
-                    slug character varying(255) NOT NULL,
-                    title character varying(255) NOT NULL,
-                    content text NOT NULL,
-                    description text,
-                    date timestamp without time zone NOT NULL
-                );
-
-                ALTER TABLE ONLY blog
-                    ADD CONSTRAINT blog_pkey PRIMARY KEY (id);
-
-                CREATE TABLE tags (
-                    id integer NOT NULL,
-                    name character varying(100) NOT NULL,
-                    created_at timestamp without time zone DEFAULT CURRENT_TIMESTAMP
-                );
-
-                ALTER TABLE ONLY tags
-                    ADD CONSTRAINT tags_pkey PRIMARY KEY (id);
-
-                CREATE TABLE blog_tags (
-                    blog_id integer NOT NULL,
-                    tag_id integer NOT NULL,
-                    created_at timestamp without time zone DEFAULT CURRENT_TIMESTAMP
-                );
-
-                ALTER TABLE ONLY blog_tags
-                    ADD CONSTRAINT blog_tags_pkey PRIMARY KEY (blog_id, tag_id);
-                """)
-
-            # Test auto-classification
-            result_auto = runner.invoke(main, ["schema.sql"])
-            assert result_auto.exit_code == 0
-            assert "blog" in result_auto.output
-            assert "tags" in result_auto.output
-            assert "blog_tags" in result_auto.output
-
-            # Test with --ignore-pk
-            result_ignore_pk = runner.invoke(main, ["schema.sql", "--ignore-pk"])
-            assert result_ignore_pk.exit_code == 0
-            # IDs should be in columns but excluded from INSERT
-            assert "INSERT INTO blog (slug, title, content" in result_ignore_pk.output or \
-                   "INSERT INTO blog" in result_ignore_pk.output
-
-    def test_many_to_many_relationship(self, runner):
+        schema = sql_corpus["kjaymiller_schema"]
+
+        # Test auto-classification
+        output_auto = run_output(schema)
+        assert "blog" in output_auto
+        assert "tags" in output_auto
+        assert "blog_tags" in output_auto
+
+        # Test with --ignore-pk
+        output_ignore_pk = run_output(schema, ignore_pk=True)
+        # IDs should be in columns but excluded from INSERT
+        assert "INSERT INTO blog (slug, title, content" in output_ignore_pk or \
+               "INSERT INTO blog" in output_ignore_pk
+
+    def test_many_to_many_relationship(self, sql_corpus):
         """Test handling of many-to-many relationships."""
-        with runner.isolated_filesystem():
-            with open("schema.sql", "w") as f:
-                f.write("""
-                CREATE TABLE posts (
-                    id integer NOT NULL,
-                    title varchar(255) NOT NULL,
-                    content text NOT NULL
-                );
-
-                CREATE TABLE categories (
-                    id integer NOT NULL,
-                    name varchar(100) NOT NULL
-                );
-
-                CREATE TABLE post_categories (
-                    post_id integer NOT NULL,
-                    category_id integer NOT NULL
-                );
-                """)
-
-            result = runner.invoke(main, ["schema.sql"])
-
-            assert result.exit_code == 0
-            # All tables should be present
-            for table in ["posts", "categories", "post_categories"]:
-                assert table in result.output
+        output = run_output(sql_corpus["unmarked_posts_categories"])
+        # All tables should be present
+        for table in ["posts", "categories", "post_categories"]:
+            assert table in output
 
 
 class TestUnifiedCLIIntegration:
     """Integration tests combining multiple features."""
 
-    def test_auto_classify_with_ignore_pk_and_timestamps(self, runner):
+    def test_auto_classify_with_ignore_pk_and_timestamps(self, sql_corpus):
         """Test auto-classification with both --ignore-pk and --ignore-timestamps."""
-        with runner.isolated_filesystem():
-            with open("schema.sql", "w") as f:
-                f.write("""
-                -- @collection
-                CREATE TABLE blog (
-                    id integer NOT NULL,
-                    title varchar(255) NOT NULL,
-                    content text NOT NULL,
-                    created_at timestamp without time zone DEFAULT CURRENT_TIMESTAMP,
-                    updated_at timestamp without time zone DEFAULT CURRENT_TIMESTAMP
-                );
-
-                ALTER TABLE ONLY blog
-                    ADD CONSTRAINT blog_pkey PRIMARY KEY (id);
-                """)
-
-            result = runner.invoke(
-                main,
-                ["schema.sql", "--ignore-pk", "--ignore-timestamps"],
-            )
-
-            assert result.exit_code == 0
-            # Both id and timestamps should be excluded
-            assert "INSERT INTO blog (title, content)" in result.output or \
-                   "INSERT INTO blog" in result.output
-
-    def test_auto_classify_output_and_verbose(self, runner):
-        """Test combining -o and -v flags."""
-        with runner.isolated_filesystem():
-            with open("schema.sql", "w") as f:
-                f.write("""
-                -- @collection
-                CREATE TABLE blog (
-                    id integer NOT NULL,
-                    title varchar(255) NOT NULL
-                );
-                """)
-
-            result = runner.invoke(
-                main,
-                ["schema.sql", "-o", "config.toml", "-v"],
-            )
-
-            assert result.exit_code == 0
-            assert Path("config.toml").exists()
-            # Verbose output should be in stderr (captured in result.output)
-            assert "Parsing" in result.output or "Found" in result.output or "Done" in result.output
+        output = run_output(
+            sql_corpus["collection_blog_timestamps_pk"],
+            ignore_pk=True,
+            ignore_timestamps=True,
+        )
+        # Both id and timestamps should be excluded
+        assert "INSERT INTO blog (title, content)" in output or \
+               "INSERT INTO blog" in output
+
+    @pytest.mark.parametrize("output_flag", ["-o", "--output"])
+    @pytest.mark.parametrize("verbose_flag", ["-v", "--verbose"])
+    def test_auto_classify_output_and_verbose(
+        self, runner, sql_corpus, tmp_path, output_flag, verbose_flag
+    ):
+        """Test combining the output and verbose flags in short and long form."""
+        config = tmp_path / "config.toml"
+
+        result = runner.invoke(
+            main,
+            [
+                str(sql_corpus["collection_blog_title"]),
+                output_flag,
+                str(config),
+                verbose_flag,
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert config.exists()
+        # Verbose output should be in stderr (captured in result.output)
+        assert "Done" in result.output
@@ -1,7 +1,11 @@
 """Tests for SQLParser - extracts render-engine objects from SQL files."""
 
+import re
+
 import pytest
 
+from conftest import SQL_SAMPLES
+from render_engine_pg.cli import sql_parser
 from render_engine_pg.cli.sql_parser import SQLParser
 
 
@@ -264,6 +268,20 @@ class TestSQLParserColumnParsing:
 
         assert set(objects[0]["columns"]) == {"id", "author_id"}
 
+    def test_extract_bare_columns_with_comments(self):
+        """Test a bare column name followed by a comma and a comment."""
+        sql = """
+        -- @page
+        CREATE TABLE posts (
+            id, -- no type
+            title -- no comma
+        );
+        """
+        parser = SQLParser()
+        objects = parser.parse(sql)
+
+        assert objects[0]["columns"] == ["id", "title"]
+
     def test_no_duplicate_columns(self):
         """Test that duplicate column names are not added."""
         sql = """
@@ -337,6 +355,39 @@ class TestSQLParserComplexScenarios:
         types = {obj["type"] for obj in objects}
         assert types == {"page", "collection", "attribute", "junction"}
 
+    def test_parse_orders_objects_by_type(self):
+        """Test objects come back grouped by type, unmarked tables last."""
+        sql = """
+        CREATE TABLE settings (
+            name VARCHAR(255)
+        );
+
+        -- @junction
+        CREATE TABLE post_tags (
+            post_id INTEGER,
+            tag_id INTEGER
+        );
+
+        -- @collection
+        CREATE TABLE blog (
+            id INTEGER PRIMARY KEY
+        );
+
+        -- @page
+        CREATE TABLE about (
+            id INTEGER PRIMARY KEY
+        );
+        """
+        parser = SQLParser()
+        objects = parser.parse(sql)
+
+        assert [obj["type"] for obj in objects] == [
+            "page",
+            "collection",
+            "junction",
+            "unmarked",
+        ]
+
     def test_parse_case_insensitive_annotations(self):
         """Test that annotations are case-insensitive."""
         sql = """
@@ -436,6 +487,22 @@ class TestSQLParserComplexScenarios:
         assert isinstance(obj, dict)
         assert all(key in obj for key in ["name", "type", "table", "columns", "attributes"])
 
+    def test_sql_object_round_trip(self):
+        """Test that SQLObject freezes a parsed dict and rebuilds it."""
+        obj = {
+            "name": "blog",
+            "type": "collection",
+            "table": "blog",
+            "columns": ["id", "title"],
+            "attributes": {"collection_name": "blog", "unique_columns": ["title"]},
+        }
+
+        frozen = sql_parser.SQLObject.from_dict(obj)
+
+        assert frozen.columns == ("id", "title")
+        assert frozen.attributes["unique_columns"] == ("title",)
+        assert frozen.to_dict() == obj
+
     def test_parse_quoted_parent_with_double_quotes(self):
         """Test parsing parent name with double quotes."""
         sql = """
@@ -716,3 +783,118 @@ class TestSQLParserIgnorePKFlag:
         assert obj["name"] == "blog"
         ignored = obj["attributes"].get("ignored_columns", [])
         assert "id" in ignored
+
+
+class TestSQLParserParseCache:
+    """Tests for reusing the parse of identical SQL."""
+
+    SQL = """
+    -- @collection
+    CREATE TABLE blog (
+        id integer NOT NULL,
+        title varchar(255) NOT NULL
+    );
+
+    ALTER TABLE ONLY blog
+        ADD CONSTRAINT blog_pkey PRIMARY KEY (id);
+    """
+
+    def test_identical_sql_parsed_once(self, mocker):
+        """Fresh parsers given the same SQL and flags share one parse."""
+        sql_parser._parse_cached.cache_clear()
+        uncached = mocker.spy(SQLParser, "_parse")
+
+        first = SQLParser().parse(self.SQL)
+        second_parser = SQLParser()
+        second = second_parser.parse(self.SQL)
+
+        assert uncached.call_count == 1
+        assert first == second
+        assert second_parser.primary_key_columns == {"blog": {"id"}}
+
+    def test_flags_are_part_of_the_cache_key(self):
+        """Parsing with different flags doesn't return a cached result."""
+        plain = SQLParser().parse(self.SQL)
+        ignoring = SQLParser(ignore_pk=True).parse(self.SQL)
+
+        assert "ignored_columns" not in plain[0]["attributes"]
+        assert ignoring[0]["attributes"]["ignored_columns"] == ["id"]
+
+    def test_returned_objects_are_copies(self):
+        """Mutating a parse result doesn't leak into later parses."""
+        first = SQLParser().parse(self.SQL)
+        first[0]["type"] = "page"
+        first[0]["columns"].append("extra")
+
+        second = SQLParser().parse(self.SQL)
+
+        assert second[0]["type"] == "collection"
+        assert second[0]["columns"] == ["id", "title"]
+
+    def test_subclasses_bypass_the_cache(self):
+        """A subclass overriding a parsing hook gets its own results."""
+
+        class UpperCaseParser(SQLParser):
+            def _parse_columns(self, *args, **kwargs):
+                columns, *rest = super()._parse_columns(*args, **kwargs)
+                return ([column.upper() for column in columns], *rest)
+
+        plain = SQLParser().parse(self.SQL)
+        upper_parser = UpperCaseParser()
+        upper = upper_parser.parse(self.SQL)
+
+        assert upper[0]["columns"] == ["ID", "TITLE"]
+        assert upper_parser.primary_key_columns == {"blog": {"id"}}
+        assert SQLParser().parse(self.SQL) == plain
+
+
+# The per-annotation-type scans SQLParser used before TABLE_PATTERN; the
+# differential test below checks the single scan finds the same tables
+LEGACY_ANNOTATION_PATTERNS = {
+    annotation_type: re.compile(
+        rf"--\s*@{annotation_type}(?:\s+['\"]?(\w+)['\"]?)?\s*\n\s*CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:\w+\.)?(\w+)\s*\((.*?)\);",
+        re.IGNORECASE | re.DOTALL,
+    )
+    for annotation_type in SQLParser.ANNOTATION_TYPES
+}
+
+DIFFERENTIAL_SCHEMAS = {
+    **SQL_SAMPLES,
+    "space_before_semicolon": """
+        -- @collection
+        CREATE TABLE blog (
+            id INTEGER PRIMARY KEY,
+            title VARCHAR(255)
+        ) ;
+
+        -- @attribute blog
+        CREATE TABLE tags (
+            id INTEGER PRIMARY KEY
+        )
+        ;
+
+        -- @junction 'blog'
+        CREATE TABLE blog_tags (
+            blog_id INTEGER,
+            tag_id INTEGER
+        );
+        """,
+}
+
+
+@pytest.mark.parametrize("schema", DIFFERENTIAL_SCHEMAS.values(), ids=DIFFERENTIAL_SCHEMAS)
+def test_single_scan_finds_the_legacy_annotated_tables(schema):
+    """The combined TABLE_PATTERN finds every table the per-type scans did."""
+    legacy = [
+        (annotation_type, match.group(2), match.group(1))
+        for annotation_type, pattern in LEGACY_ANNOTATION_PATTERNS.items()
+        for match in pattern.finditer(schema)
+    ]
+
+    objects = SQLParser().parse(schema)
+
+    assert [
+        (obj["type"], obj["table"], obj["attributes"].get("parent_collection"))
+        for obj in objects
+        if obj["type"] != "unmarked"
+    ] == legacy